@@ -0,0 +1,86 @@
+from hashlib import sha1
+from json import JSONDecodeError, dump, load
+from pathlib import Path
+from typing import List
+
+# Per Input Dataset Cache File, Holding the Mergeable Error Statistics per Estimator Formula and max_S Bounds of Each
+# Input File (Keyed by Its Path Relative to the Dataset), Valid While the File Keeps the Same Size and Modification Time
+analyzer_cache_format_version = 2
+
+
+def get_analyzer_cache_file(cache_directory_path: Path,
+                            input_file_path: Path,
+                            input_format: str) -> Path:
+    input_dataset_key = "{0}:{1}".format(str(input_file_path.resolve()), input_format)
+    return cache_directory_path.joinpath(sha1(input_dataset_key.encode("utf-8")).hexdigest() + ".json")
+
+
+def load_analyzer_cache(analyzer_cache_file: Path) -> dict:
+    # A Missing, Unreadable or Older Format Cache Is Treated as Empty (Everything Gets Recomputed)
+    try:
+        with open(file=analyzer_cache_file, mode="r") as cache_file:
+            analyzer_cache = load(cache_file)
+    except (OSError, JSONDecodeError):
+        return {}
+    if analyzer_cache.get("format_version") != analyzer_cache_format_version:
+        return {}
+    return analyzer_cache.get("input_files", {})
+
+
+def save_analyzer_cache(analyzer_cache_file: Path,
+                        analyzer_cache: dict) -> None:
+    # Written to a Hidden File and Renamed, So an Interrupted Run Never Leaves a Truncated Cache
+    analyzer_cache_file.parent.mkdir(parents=True, exist_ok=True)
+    temporary_analyzer_cache_file = analyzer_cache_file.with_name("." + analyzer_cache_file.name)
+    with open(file=temporary_analyzer_cache_file, mode="w") as cache_file:
+        dump({"format_version": analyzer_cache_format_version,
+              "input_files": analyzer_cache},
+             cache_file)
+    temporary_analyzer_cache_file.replace(analyzer_cache_file)
+
+
+def get_input_file_cache_key(input_file: Path,
+                             input_root_path: Path) -> str:
+    if input_file == input_root_path:
+        return input_file.name
+    return input_file.relative_to(input_root_path).as_posix()
+
+
+def get_input_file_signature(input_file: Path) -> List[int]:
+    input_file_stat = input_file.stat()
+    return [input_file_stat.st_size, input_file_stat.st_mtime_ns]
+
+
+def split_cached_input_files(input_files: List[Path],
+                             input_root_path: Path,
+                             analyzer_cache: dict,
+                             estimator_formula_names: List[str]) -> List:
+    # Returns [Cached Error Statistics per Estimator Formula and max_S Bounds of the Unchanged Input Files,
+    # New or Changed Input Files]. A File Cached Without One of the Estimator Formulas Is Aggregated Again
+    cached_error_statistics_by_estimator_formula_list = []
+    changed_input_files = []
+    for input_file in input_files:
+        cache_entry = analyzer_cache.get(get_input_file_cache_key(input_file, input_root_path))
+        if cache_entry is not None \
+                and cache_entry["signature"] == get_input_file_signature(input_file) \
+                and all(estimator_formula_name in cache_entry["error_statistics_by_estimator_formula"]
+                        for estimator_formula_name in estimator_formula_names):
+            cached_error_statistics_by_estimator_formula_list.append(cache_entry
+                                                                     ["error_statistics_by_estimator_formula"])
+        else:
+            changed_input_files.append(input_file)
+    return [cached_error_statistics_by_estimator_formula_list, changed_input_files]
+
+
+def update_analyzer_cache(analyzer_cache: dict,
+                          input_root_path: Path,
+                          error_statistics_by_estimator_formula_by_input_file: dict) -> None:
+    # Store the Newly Aggregated Input Files and Drop the Entries of Input Files No Longer Present
+    for input_file, error_statistics_by_estimator_formula \
+            in error_statistics_by_estimator_formula_by_input_file.items():
+        analyzer_cache[get_input_file_cache_key(input_file, input_root_path)] = \
+            {"signature": get_input_file_signature(input_file),
+             "error_statistics_by_estimator_formula": error_statistics_by_estimator_formula}
+    for input_file_cache_key in list(analyzer_cache.keys()):
+        if not (input_root_path.joinpath(input_file_cache_key).is_file() or input_root_path.is_file()):
+            del analyzer_cache[input_file_cache_key]
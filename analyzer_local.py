@@ -0,0 +1,290 @@
+from analyzer_cache import get_analyzer_cache_file, load_analyzer_cache, save_analyzer_cache, \
+    split_cached_input_files, update_analyzer_cache
+from csv import reader
+from error_statistics import create_error_statistics, get_analysis_report_lists, merge_error_statistics, \
+    merge_error_statistics_by_max_s_range, print_analysis_report, print_candidate_estimator_formula_header, \
+    print_stratified_sample_header, update_error_statistics, weight_error_statistics_by_stratum
+from estimator_parallel import max_s_case_labels
+from estimator_sampling import get_stratum_weights, load_sampling_strata_file, sampling_strata_file_name
+from pathlib import Path
+from typing import List
+
+
+def list_input_csv_files(input_file_path: Path) -> List[Path]:
+    # Like Spark, Skip Hidden ("." or "_" Prefixed) Files and Directories of an Input Directory, Reading the Ones of
+    # Partition Subdirectories (Such as the Estimator's shard=<Index>)
+    if not input_file_path.is_dir():
+        return [input_file_path]
+    return sorted(input_csv_file for input_csv_file in input_file_path.glob("**/*.csv")
+                  if not any(path_part.startswith((".", "_"))
+                             for path_part in input_csv_file.relative_to(input_file_path).parts))
+
+
+def load_input_stratum_weights(input_file_path: Path) -> dict:
+    # Stratum Weights of an Input Directory Written on stratified Sampling (Empty if Not Sampled). Shards Draw the
+    # Same Strata, So the Strata File of Any of Them Will Do
+    if not input_file_path.is_dir():
+        return {}
+    for sampling_strata_file in sorted(input_file_path.glob("**/" + sampling_strata_file_name)):
+        return get_stratum_weights(load_sampling_strata_file(sampling_strata_file),
+                                   max_s_case_labels)
+    return {}
+
+
+def get_stratum_range_key(range_case: str,
+                          n_decade: int) -> str:
+    # On stratified Sampling, Error Statistics Are Kept per (max_S Bounds, n Decade) Stratum Until Weighted
+    return "{0}|{1}".format(range_case, n_decade)
+
+
+def weight_error_statistics_by_stratum_range_key(error_statistics_by_stratum_range_key: dict,
+                                                 stratum_weights: dict) -> dict:
+    error_statistics_by_stratum = {}
+    for stratum_range_key, error_statistics in error_statistics_by_stratum_range_key.items():
+        range_case, n_decade = stratum_range_key.rsplit("|", 1)
+        error_statistics_by_stratum[(range_case, int(n_decade))] = error_statistics
+    return weight_error_statistics_by_stratum(error_statistics_by_stratum,
+                                              stratum_weights)
+
+
+def get_error_column_names(estimator_formula_name: str,
+                           input_format: str) -> List[str]:
+    # Relative and Percent Error Columns of an Estimator Formula (the Candidates' Are Suffixed by Their Name)
+    if input_format == "parquet":
+        if estimator_formula_name == "default":
+            return ["relative_error", "percent_error"]
+        return ["relative_error_" + estimator_formula_name, "percent_error_" + estimator_formula_name]
+    if estimator_formula_name == "default":
+        return ["Relative Error", "Percent Error (%)"]
+    return ["Relative Error [{0}]".format(estimator_formula_name),
+            "Percent Error (%) [{0}]".format(estimator_formula_name)]
+
+
+def aggregate_csv_file(input_csv_file: Path,
+                       estimator_formula_names: List[str],
+                       stratified: bool) -> dict:
+    # Stream the File Row by Row, Keeping Only the Running Error Statistics of Each Estimator Formula and max_S Bounds
+    # (and n Decade, When stratified)
+    error_statistics_by_estimator_formula = {estimator_formula_name: {}
+                                             for estimator_formula_name in estimator_formula_names}
+    with open(file=input_csv_file, mode="r", newline="") as csv_file:
+        csv_reader = reader(csv_file)
+        header_field_names = next(csv_reader, None)
+        if header_field_names is None:
+            return error_statistics_by_estimator_formula
+        max_s_bounds_index = header_field_names.index("max_S Bounds")
+        n_index = header_field_names.index("n")
+        error_indices_by_estimator_formula = \
+            [[error_statistics_by_estimator_formula[estimator_formula_name]]
+             + [header_field_names.index(error_column_name)
+                for error_column_name in get_error_column_names(estimator_formula_name, "csv")]
+             for estimator_formula_name in estimator_formula_names]
+        for csv_row in csv_reader:
+            range_case = csv_row[max_s_bounds_index]
+            if stratified:
+                range_case = get_stratum_range_key(range_case, len(csv_row[n_index]))
+            for error_statistics_by_max_s_range, relative_error_index, percent_error_index \
+                    in error_indices_by_estimator_formula:
+                error_statistics = error_statistics_by_max_s_range.get(range_case)
+                if error_statistics is None:
+                    error_statistics = error_statistics_by_max_s_range[range_case] = create_error_statistics()
+                update_error_statistics(error_statistics,
+                                        float(csv_row[relative_error_index]),
+                                        float(csv_row[percent_error_index]))
+    return error_statistics_by_estimator_formula
+
+
+def aggregate_parquet_batch_errors(relative_errors,
+                                   percent_errors) -> list:
+    from pyarrow.compute import equal, filter, max, mean, min, not_equal, sum, variance
+    # Batch Error Statistics, Computed Column-Wise and Then Merged Like Any Other Partial Aggregate
+    error_statistics = create_error_statistics()
+    error_statistics[0] = len(relative_errors)
+    error_statistics[1] = sum(equal(relative_errors, 0.0)).as_py() or 0
+    erroneous = not_equal(relative_errors, 0.0)
+    erroneous_relative_errors = filter(relative_errors, erroneous)
+    erroneous_percent_errors = filter(percent_errors, erroneous)
+    error_statistics[2] = len(erroneous_relative_errors)
+    if error_statistics[2] > 0:
+        for moments_index, erroneous_errors in [(3, erroneous_relative_errors), (4, erroneous_percent_errors)]:
+            error_statistics[moments_index] = [min(erroneous_errors).as_py(),
+                                               max(erroneous_errors).as_py(),
+                                               mean(erroneous_errors).as_py(),
+                                               variance(erroneous_errors, ddof=0).as_py() * error_statistics[2]]
+    return error_statistics
+
+
+def get_partition_value(input_file: Path,
+                        input_root_path: Path,
+                        partition_column: str):
+    # Value of a <partition_column>=<Value> Directory Between the Input Root and the File (None if Absent)
+    for path_part in input_file.relative_to(input_root_path).parts[:-1]:
+        if path_part.startswith(partition_column + "="):
+            return int(path_part.split("=", 1)[1])
+    return None
+
+
+def list_input_parquet_files(input_file_path: Path,
+                             max_s_cases: List[int],
+                             n_ranges: List[int]) -> List[Path]:
+    # Partition Pruning: Keep Only the Files of the Requested max_s_case=<Case>/n_range=<Range> Directories
+    input_parquet_files = []
+    for input_parquet_file in sorted(input_file_path.glob("**/*.parquet")):
+        if any(path_part.startswith((".", "_"))
+               for path_part in input_parquet_file.relative_to(input_file_path).parts):
+            continue
+        if max_s_cases and get_partition_value(input_parquet_file, input_file_path, "max_s_case") not in max_s_cases:
+            continue
+        if n_ranges and get_partition_value(input_parquet_file, input_file_path, "n_range") not in n_ranges:
+            continue
+        input_parquet_files.append(input_parquet_file)
+    return input_parquet_files
+
+
+def aggregate_parquet_file(input_parquet_file: Path,
+                           input_root_path: Path,
+                           estimator_formula_names: List[str],
+                           stratified: bool) -> dict:
+    from pyarrow import string
+    from pyarrow.compute import cast, equal, filter, unique, utf8_length
+    from pyarrow.parquet import ParquetFile
+    # Stream Record Batches of Only the Error Columns (the max_S Case Is the File's Partition Directory), Plus n
+    # When stratified
+    range_case = str(max_s_case_labels.get(get_partition_value(input_parquet_file,
+                                                               input_root_path,
+                                                               "max_s_case")))
+    error_column_names_by_estimator_formula = {estimator_formula_name: get_error_column_names(estimator_formula_name,
+                                                                                              "parquet")
+                                               for estimator_formula_name in estimator_formula_names}
+    error_statistics_by_estimator_formula = {estimator_formula_name: {}
+                                             for estimator_formula_name in estimator_formula_names}
+    for record_batch in ParquetFile(input_parquet_file) \
+            .iter_batches(columns=(["n"] if stratified else [])
+                          + [error_column_name
+                             for error_column_names in error_column_names_by_estimator_formula.values()
+                             for error_column_name in error_column_names]):
+        range_filters = [(range_case, None)]
+        if stratified:
+            n_decades = utf8_length(cast(record_batch["n"], string()))
+            range_filters = [(get_stratum_range_key(range_case, n_decade), equal(n_decades, n_decade))
+                             for n_decade in unique(n_decades).to_pylist()]
+        for range_key, range_filter in range_filters:
+            for estimator_formula_name, error_column_names in error_column_names_by_estimator_formula.items():
+                relative_errors = record_batch[error_column_names[0]]
+                percent_errors = record_batch[error_column_names[1]]
+                if range_filter is not None:
+                    relative_errors = filter(relative_errors, range_filter)
+                    percent_errors = filter(percent_errors, range_filter)
+                error_statistics_by_max_s_range = error_statistics_by_estimator_formula[estimator_formula_name]
+                error_statistics_by_max_s_range[range_key] = \
+                    merge_error_statistics(error_statistics_by_max_s_range.get(range_key, create_error_statistics()),
+                                           aggregate_parquet_batch_errors(relative_errors,
+                                                                          percent_errors))
+    return error_statistics_by_estimator_formula
+
+
+def list_input_files(input_file_path: Path,
+                     input_format: str,
+                     max_s_cases: List[int],
+                     n_ranges: List[int]) -> List[Path]:
+    if input_format == "parquet":
+        return list_input_parquet_files(input_file_path,
+                                        max_s_cases,
+                                        n_ranges)
+    return list_input_csv_files(input_file_path)
+
+
+def merge_error_statistics_by_estimator_formula(error_statistics_by_estimator_formula_list: List[dict],
+                                                estimator_formula_names: List[str]) -> dict:
+    # Error Statistics per max_S Bounds of Each Estimator Formula, Merged Over All Input Files
+    error_statistics_by_estimator_formula = {estimator_formula_name: {}
+                                             for estimator_formula_name in estimator_formula_names}
+    for input_file_error_statistics_by_estimator_formula in error_statistics_by_estimator_formula_list:
+        for estimator_formula_name in estimator_formula_names:
+            merge_error_statistics_by_max_s_range(error_statistics_by_estimator_formula[estimator_formula_name],
+                                                  input_file_error_statistics_by_estimator_formula
+                                                  [estimator_formula_name])
+    return error_statistics_by_estimator_formula
+
+
+def print_estimator_formula_analysis_reports(error_statistics_by_estimator_formula: dict,
+                                             stratum_weights: dict) -> None:
+    # The Default Estimator Formula Report, Followed by the Report of Each Candidate Estimator Formula
+    # (Weighting the Strata First on a stratified Sample)
+    if stratum_weights:
+        print_stratified_sample_header()
+    for estimator_formula_name, error_statistics_by_max_s_range in error_statistics_by_estimator_formula.items():
+        if stratum_weights:
+            error_statistics_by_max_s_range = \
+                weight_error_statistics_by_stratum_range_key(error_statistics_by_max_s_range,
+                                                             stratum_weights)
+        if estimator_formula_name != "default":
+            print_candidate_estimator_formula_header(estimator_formula_name)
+        print_analysis_report(*get_analysis_report_lists(error_statistics_by_max_s_range))
+
+
+def execute_local_analysis(analyzer_config: List) -> None:
+    # Get Input File Path
+    input_file_path = Path(analyzer_config[0])
+    # Get Input Format
+    input_format = analyzer_config[1]
+    # Get max_S Cases (Empty List = All Cases)
+    max_s_cases = analyzer_config[2]
+    # Get n Ranges (Empty List = All Ranges)
+    n_ranges = analyzer_config[3]
+    # Get Cache Directory (Empty = No Cache)
+    cache_directory = analyzer_config[6]
+    # Get Estimator Formulas (the Default One and the Candidates)
+    estimator_formula_names = ["default"] + analyzer_config[7]
+    # Get Stratum Weights (Empty Unless the Input Is a stratified Sample)
+    stratum_weights = load_input_stratum_weights(input_file_path)
+    # List Input Files (Pruned by Partition on parquet)
+    input_files = list_input_files(input_file_path,
+                                   input_format,
+                                   max_s_cases,
+                                   n_ranges)
+    # Split Input Files Into Cached (Unchanged Since the Last Run) and New or Changed Ones
+    analyzer_cache = {}
+    error_statistics_by_estimator_formula_list = []
+    changed_input_files = input_files
+    if cache_directory:
+        analyzer_cache_file = get_analyzer_cache_file(Path(cache_directory),
+                                                      input_file_path,
+                                                      input_format)
+        analyzer_cache = load_analyzer_cache(analyzer_cache_file)
+        error_statistics_by_estimator_formula_list, changed_input_files = \
+            split_cached_input_files(input_files,
+                                     input_file_path,
+                                     analyzer_cache,
+                                     estimator_formula_names)
+        print("Number of Cached Input Files: {0}".format(len(error_statistics_by_estimator_formula_list)))
+    print("Number of Aggregated Input Files: {0}".format(len(changed_input_files)))
+    # Aggregate Error Statistics per Estimator Formula and max_S Bounds of Each New or Changed Input File
+    error_statistics_by_estimator_formula_by_input_file = {}
+    for input_file in changed_input_files:
+        if input_format == "parquet":
+            error_statistics_by_estimator_formula_by_input_file[input_file] = \
+                aggregate_parquet_file(input_file,
+                                       input_file_path,
+                                       estimator_formula_names,
+                                       bool(stratum_weights))
+        else:
+            error_statistics_by_estimator_formula_by_input_file[input_file] = \
+                aggregate_csv_file(input_file,
+                                   estimator_formula_names,
+                                   bool(stratum_weights))
+    error_statistics_by_estimator_formula_list.extend(error_statistics_by_estimator_formula_by_input_file.values())
+    # Update Cache
+    if cache_directory:
+        update_analyzer_cache(analyzer_cache,
+                              input_file_path,
+                              error_statistics_by_estimator_formula_by_input_file)
+        save_analyzer_cache(analyzer_cache_file,
+                            analyzer_cache)
+    # Merge Error Statistics per Estimator Formula and max_S Bounds of All Input Files
+    error_statistics_by_estimator_formula = \
+        merge_error_statistics_by_estimator_formula(error_statistics_by_estimator_formula_list,
+                                                    estimator_formula_names)
+    # Print Analysis Reports
+    print_estimator_formula_analysis_reports(error_statistics_by_estimator_formula,
+                                             stratum_weights)
@@ -0,0 +1,372 @@
+from analyzer_cache import get_analyzer_cache_file, load_analyzer_cache, save_analyzer_cache, \
+    split_cached_input_files, update_analyzer_cache
+from analyzer_local import get_error_column_names, list_input_files, load_input_stratum_weights, \
+    merge_error_statistics_by_estimator_formula, print_estimator_formula_analysis_reports
+from error_statistics import print_analysis_report, print_candidate_estimator_formula_header
+from estimator_parallel import get_candidate_estimator_formula_field_names, max_s_case_labels
+from math import inf
+from pathlib import Path
+from pyspark import SparkConf, SparkContext
+from pyspark.sql import Column, DataFrame, SparkSession
+from pyspark.sql.functions import avg, col, concat_ws, count, input_file_name, length, lit, max, min, stddev, var_pop, \
+    when
+from pyspark.sql.types import ByteType, DoubleType, IntegerType, LongType, StringType, StructField, StructType
+from typing import List, Optional
+from urllib.parse import unquote, urlparse
+
+
+def create_spark_conf(spark_application_properties: List) -> SparkConf:
+    spark_conf = SparkConf()
+    for (key, value) in spark_application_properties:
+        spark_conf.set(key, value)
+    return spark_conf
+
+
+def get_or_create_spark_session(spark_conf: SparkConf) -> SparkSession:
+    spark_session = \
+        SparkSession \
+        .builder \
+        .config(conf=spark_conf) \
+        .getOrCreate()
+    return spark_session
+
+
+def get_spark_context_from_spark_session(spark_session: SparkSession) -> SparkContext:
+    spark_context = spark_session.sparkContext
+    return spark_context
+
+
+def get_csv_input_schema(candidate_estimator_formula_names: List[str]) -> StructType:
+    # Columns Written by estimator_parallel.write_csv_file_header
+    csv_input_schema = StructType([StructField("n", LongType(), False),
+                                   StructField("max_S", LongType(), False),
+                                   StructField("max_S Bounds", StringType(), False),
+                                   StructField("Actual D_a", LongType(), False),
+                                   StructField("Estimated D_a", LongType(), False),
+                                   StructField("Absolute Error", LongType(), False),
+                                   StructField("Relative Error", DoubleType(), False),
+                                   StructField("Percent Error (%)", DoubleType(), False)])
+    for candidate_estimator_formula_name in candidate_estimator_formula_names:
+        for field_name, field_type in zip(get_candidate_estimator_formula_field_names(candidate_estimator_formula_name),
+                                          [LongType(), LongType(), DoubleType(), DoubleType()]):
+            csv_input_schema.add(StructField(field_name, field_type, False))
+    return csv_input_schema
+
+
+def load_csv_dataframe(spark_session: SparkSession,
+                       input_file_paths: List[str],
+                       infer_schema: bool,
+                       candidate_estimator_formula_names: List[str]) -> DataFrame:
+    if infer_schema:
+        # Schema Inference Costs an Extra Full Pass Over the Input
+        return spark_session.read.csv(input_file_paths,
+                                      header=True,
+                                      inferSchema=True)
+    return spark_session.read.csv(input_file_paths,
+                                  header=True,
+                                  schema=get_csv_input_schema(candidate_estimator_formula_names))
+
+
+def get_parquet_input_schema(candidate_estimator_formula_names: List[str]) -> StructType:
+    # Same Columns as estimator_parquet.get_result_schema, Plus the max_s_case and n_range Partition Columns
+    parquet_input_schema = StructType([StructField("n", LongType(), False),
+                                       StructField("max_s", LongType(), False),
+                                       StructField("actual_d_a", LongType(), False),
+                                       StructField("estimated_d_a", LongType(), False),
+                                       StructField("absolute_error", LongType(), False),
+                                       StructField("relative_error", DoubleType(), False),
+                                       StructField("percent_error", DoubleType(), False)])
+    for candidate_estimator_formula_name in candidate_estimator_formula_names:
+        for field_name, field_type in [("estimated_d_a", LongType()),
+                                       ("absolute_error", LongType()),
+                                       ("relative_error", DoubleType()),
+                                       ("percent_error", DoubleType())]:
+            parquet_input_schema.add(StructField("{0}_{1}".format(field_name, candidate_estimator_formula_name),
+                                                 field_type,
+                                                 False))
+    parquet_input_schema.add(StructField("max_s_case", ByteType(), False))
+    parquet_input_schema.add(StructField("n_range", IntegerType(), False))
+    return parquet_input_schema
+
+
+def get_max_s_case_label_column(max_s_case_column: Column) -> Column:
+    max_s_case_label_column = lit("None")
+    for max_s_case, max_s_case_label in sorted(max_s_case_labels.items(), reverse=True):
+        max_s_case_label_column = when(max_s_case_column == max_s_case, lit(max_s_case_label)) \
+            .otherwise(max_s_case_label_column)
+    return max_s_case_label_column
+
+
+def load_parquet_dataframe(spark_session: SparkSession,
+                           input_file_path: str,
+                           input_file_paths: List[str],
+                           max_s_cases: List[int],
+                           n_ranges: List[int],
+                           candidate_estimator_formula_names: List[str]) -> DataFrame:
+    # Partition Columns Are Discovered Below input_file_path, Also When Reading Only Some of Its Files
+    df = spark_session.read.schema(get_parquet_input_schema(candidate_estimator_formula_names)) \
+        .option("basePath", input_file_path) \
+        .parquet(*input_file_paths)
+    # Filters on Partition Columns Prune Whole max_s_case=<Case>/n_range=<Range> Directories
+    if max_s_cases:
+        df = df.filter(col("max_s_case").isin(max_s_cases))
+    if n_ranges:
+        df = df.filter(col("n_range").isin(n_ranges))
+    # Expose the Same Columns as the CSV Output
+    candidate_columns = []
+    for candidate_estimator_formula_name in candidate_estimator_formula_names:
+        for field_name, csv_field_name in zip(["estimated_d_a", "absolute_error", "relative_error", "percent_error"],
+                                              get_candidate_estimator_formula_field_names(
+                                                  candidate_estimator_formula_name)):
+            candidate_columns.append(col("{0}_{1}".format(field_name, candidate_estimator_formula_name))
+                                     .alias(csv_field_name))
+    df = df.select(col("n"),
+                   col("max_s").alias("max_S"),
+                   get_max_s_case_label_column(col("max_s_case")).alias("max_S Bounds"),
+                   col("actual_d_a").alias("Actual D_a"),
+                   col("estimated_d_a").alias("Estimated D_a"),
+                   col("absolute_error").alias("Absolute Error"),
+                   col("relative_error").alias("Relative Error"),
+                   col("percent_error").alias("Percent Error (%)"),
+                   *candidate_columns)
+    return df
+
+
+def get_error_aggregate_columns(estimator_formula_name: str,
+                                variance_function) -> List[Column]:
+    # Errors-Free Occurrences and Statistics of the Erroneous Occurrences of an Estimator Formula
+    # (Conditional Aggregates Skip the Rows Whose when() Condition Yields Null)
+    relative_error_column_name, percent_error_column_name = get_error_column_names(estimator_formula_name,
+                                                                                   "csv")
+    relative_error = col("`{0}`".format(relative_error_column_name))
+    percent_error = col("`{0}`".format(percent_error_column_name))
+    is_error_free = relative_error == 0.0
+    is_erroneous = relative_error != 0.0
+    return [count(when(is_error_free, lit(1))),
+            count(when(is_erroneous, lit(1))),
+            min(when(is_erroneous, relative_error)),
+            max(when(is_erroneous, relative_error)),
+            avg(when(is_erroneous, relative_error)),
+            variance_function(when(is_erroneous, relative_error)),
+            min(when(is_erroneous, percent_error)),
+            max(when(is_erroneous, percent_error)),
+            avg(when(is_erroneous, percent_error)),
+            variance_function(when(is_erroneous, percent_error))]
+
+
+def get_local_input_file_path(input_file_path: str) -> Optional[Path]:
+    # The Cache and the Strata File Need to List, stat and Read the Input Files Locally: None When the Input Is on
+    # Another File System (hdfs://, s3a://, ...), Which pathlib Cannot Handle (It Collapses "//" in the URI)
+    parsed_input_file_path = urlparse(input_file_path)
+    if parsed_input_file_path.scheme == "file":
+        local_input_file_path = Path(unquote(parsed_input_file_path.path))
+    elif parsed_input_file_path.scheme == "":
+        local_input_file_path = Path(input_file_path)
+    else:
+        return None
+    if not local_input_file_path.exists():
+        return None
+    return local_input_file_path
+
+
+def execute_analysis(spark_session: SparkSession,
+                     analyzer_config_file: List) -> None:
+    # Get Input File Path
+    input_file_path = analyzer_config_file[0]
+    # Get Input Format
+    input_format = analyzer_config_file[1]
+    # Get max_S Cases (Empty List = All Cases)
+    max_s_cases = analyzer_config_file[2]
+    # Get n Ranges (Empty List = All Ranges)
+    n_ranges = analyzer_config_file[3]
+    # Get Infer Schema
+    infer_schema = analyzer_config_file[4]
+    # Get Cache Directory (Empty = No Cache)
+    cache_directory = analyzer_config_file[6]
+    # Get Candidate Estimator Formulas
+    candidate_estimator_formula_names = analyzer_config_file[7]
+    # Get Local Input File Path (None on Other File Systems)
+    local_input_file_path = get_local_input_file_path(input_file_path)
+    if local_input_file_path is not None:
+        if cache_directory or load_input_stratum_weights(local_input_file_path):
+            # Aggregate Only the Input Files Changed Since the Last Run, Merging the Cached Ones, or Aggregate per
+            # Stratum to Weight a stratified Sample
+            execute_per_input_file_analysis(spark_session,
+                                            local_input_file_path,
+                                            analyzer_config_file)
+            return
+    elif cache_directory:
+        print("Input File Path Not on the Local File System: Cache Directory Ignored, Analyzing in a Single Pass")
+    # Load DataFrame
+    if input_format == "parquet":
+        df1 = load_parquet_dataframe(spark_session,
+                                     input_file_path,
+                                     [input_file_path],
+                                     max_s_cases,
+                                     n_ranges,
+                                     candidate_estimator_formula_names)
+    else:
+        df1 = load_csv_dataframe(spark_session,
+                                 [input_file_path],
+                                 infer_schema,
+                                 candidate_estimator_formula_names)
+    # Single-Pass Aggregation per max_S Bounds of Every Estimator Formula: Number of Combinations, Then the
+    # Errors-Free Occurrences and Statistics of the Erroneous Occurrences of Each Estimator Formula
+    estimator_formula_names = ["default"] + candidate_estimator_formula_names
+    error_aggregate_columns = []
+    for estimator_formula_name in estimator_formula_names:
+        error_aggregate_columns.extend(get_error_aggregate_columns(estimator_formula_name,
+                                                                   stddev))
+    df_analysis = \
+        df1.groupby("max_S Bounds") \
+           .agg(count(lit(1)),
+                *error_aggregate_columns) \
+           .sort("max_S Bounds")
+    analysis_by_max_s_range_list = [row for row in df_analysis.collect()]
+    # Total Number of Combinations of n and max_S
+    total_number_of_combinations = sum([analysis_by_max_s_range[1]
+                                        for analysis_by_max_s_range in analysis_by_max_s_range_list])
+    for estimator_formula_index, estimator_formula_name in enumerate(estimator_formula_names):
+        errors_free_index = 2 + 10 * estimator_formula_index
+        # Estimation Errors-Free Analysis
+        errors_free_by_max_s_range_list = [[analysis_by_max_s_range[0], analysis_by_max_s_range[errors_free_index]]
+                                           for analysis_by_max_s_range in analysis_by_max_s_range_list
+                                           if analysis_by_max_s_range[errors_free_index] > 0]
+        # Estimation With Errors Analysis
+        errors_by_max_s_range_list = [[analysis_by_max_s_range[0]]
+                                      + list(analysis_by_max_s_range[errors_free_index + 1:errors_free_index + 10])
+                                      for analysis_by_max_s_range in analysis_by_max_s_range_list
+                                      if analysis_by_max_s_range[errors_free_index + 1] > 0]
+        if estimator_formula_name != "default":
+            print_candidate_estimator_formula_header(estimator_formula_name)
+        print_analysis_report(total_number_of_combinations,
+                              errors_free_by_max_s_range_list,
+                              errors_by_max_s_range_list)
+
+
+def aggregate_input_files(spark_session: SparkSession,
+                          input_file_path: Path,
+                          input_format: str,
+                          input_files: List[Path],
+                          infer_schema: bool,
+                          candidate_estimator_formula_names: List[str],
+                          stratified: bool) -> dict:
+    # Mergeable Error Statistics per Estimator Formula and max_S Bounds (and n Decade, When stratified) of Each
+    # Input File, in One Grouped Pass Over the Input Files
+    estimator_formula_names = ["default"] + candidate_estimator_formula_names
+    error_statistics_by_estimator_formula_by_input_file = {input_file: {estimator_formula_name: {}
+                                                                        for estimator_formula_name
+                                                                        in estimator_formula_names}
+                                                           for input_file in input_files}
+    if not input_files:
+        return error_statistics_by_estimator_formula_by_input_file
+    input_file_paths = [str(input_file) for input_file in input_files]
+    if input_format == "parquet":
+        df1 = load_parquet_dataframe(spark_session,
+                                     str(input_file_path),
+                                     input_file_paths,
+                                     [],
+                                     [],
+                                     candidate_estimator_formula_names)
+    else:
+        df1 = load_csv_dataframe(spark_session,
+                                 input_file_paths,
+                                 infer_schema,
+                                 candidate_estimator_formula_names)
+    error_aggregate_columns = []
+    for estimator_formula_name in estimator_formula_names:
+        error_aggregate_columns.extend(get_error_aggregate_columns(estimator_formula_name,
+                                                                   var_pop))
+    # Same Keys as analyzer_local.get_stratum_range_key on stratified Sampling
+    range_key_column = col("max_S Bounds")
+    if stratified:
+        range_key_column = concat_ws("|", col("max_S Bounds"), length(col("n").cast("string")))
+    df_analysis = \
+        df1.groupby(input_file_name().alias("Input File"), range_key_column.alias("Range Key")) \
+           .agg(count(lit(1)),
+                *error_aggregate_columns)
+    # Spark Reports Input Files as URIs of Their Absolute Paths
+    input_files_by_resolved_path = {str(input_file.resolve()): input_file for input_file in input_files}
+    for row in df_analysis.collect():
+        input_file = input_files_by_resolved_path[str(Path(unquote(urlparse(row[0]).path)).resolve())]
+        for estimator_formula_index, estimator_formula_name in enumerate(estimator_formula_names):
+            errors_free_index = 3 + 10 * estimator_formula_index
+            number_of_occurrences = row[errors_free_index + 1]
+            error_statistics = [row[2], row[errors_free_index], number_of_occurrences]
+            for moments_index in [errors_free_index + 2, errors_free_index + 6]:
+                if number_of_occurrences > 0:
+                    error_statistics.append([row[moments_index],
+                                             row[moments_index + 1],
+                                             row[moments_index + 2],
+                                             row[moments_index + 3] * number_of_occurrences])
+                else:
+                    error_statistics.append([inf, -inf, 0.0, 0.0])
+            error_statistics_by_estimator_formula_by_input_file[input_file][estimator_formula_name][str(row[1])] = \
+                error_statistics
+    return error_statistics_by_estimator_formula_by_input_file
+
+
+def execute_per_input_file_analysis(spark_session: SparkSession,
+                                    input_file_path: Path,
+                                    analyzer_config_file: List) -> None:
+    # Error Statistics Aggregated per Input File (Local Input Only), Then Merged (Reusing the Cached Ones of
+    # Unchanged Input Files)
+    # Get Input Format
+    input_format = analyzer_config_file[1]
+    # Get Infer Schema
+    infer_schema = analyzer_config_file[4]
+    # Get Cache Directory (Empty = No Cache)
+    cache_directory = analyzer_config_file[6]
+    # Get Estimator Formulas (the Default One and the Candidates)
+    candidate_estimator_formula_names = analyzer_config_file[7]
+    estimator_formula_names = ["default"] + candidate_estimator_formula_names
+    # Get Stratum Weights (Empty Unless the Input Is a stratified Sample)
+    stratum_weights = load_input_stratum_weights(input_file_path)
+    # List Input Files (Pruned by Partition on parquet)
+    input_files = list_input_files(input_file_path,
+                                   input_format,
+                                   analyzer_config_file[2],
+                                   analyzer_config_file[3])
+    # Split Input Files Into Cached (Unchanged Since the Last Run) and New or Changed Ones
+    analyzer_cache = {}
+    error_statistics_by_estimator_formula_list = []
+    changed_input_files = input_files
+    if cache_directory:
+        analyzer_cache_file = get_analyzer_cache_file(Path(cache_directory),
+                                                      input_file_path,
+                                                      input_format)
+        analyzer_cache = load_analyzer_cache(analyzer_cache_file)
+        error_statistics_by_estimator_formula_list, changed_input_files = \
+            split_cached_input_files(input_files,
+                                     input_file_path,
+                                     analyzer_cache,
+                                     estimator_formula_names)
+        print("Number of Cached Input Files: {0}".format(len(error_statistics_by_estimator_formula_list)))
+    print("Number of Aggregated Input Files: {0}".format(len(changed_input_files)))
+    # Aggregate Error Statistics per Estimator Formula and max_S Bounds of Each New or Changed Input File
+    error_statistics_by_estimator_formula_by_input_file = aggregate_input_files(spark_session,
+                                                                                input_file_path,
+                                                                                input_format,
+                                                                                changed_input_files,
+                                                                                infer_schema,
+                                                                                candidate_estimator_formula_names,
+                                                                                bool(stratum_weights))
+    error_statistics_by_estimator_formula_list.extend(error_statistics_by_estimator_formula_by_input_file.values())
+    # Update Cache
+    if cache_directory:
+        update_analyzer_cache(analyzer_cache,
+                              input_file_path,
+                              error_statistics_by_estimator_formula_by_input_file)
+        save_analyzer_cache(analyzer_cache_file,
+                            analyzer_cache)
+    # Merge Error Statistics per Estimator Formula and max_S Bounds of All Input Files
+    error_statistics_by_estimator_formula = \
+        merge_error_statistics_by_estimator_formula(error_statistics_by_estimator_formula_list,
+                                                    estimator_formula_names)
+    # Print Analysis Reports
+    print_estimator_formula_analysis_reports(error_statistics_by_estimator_formula,
+                                             stratum_weights)
+
+
+def stop_spark_session(spark_session: SparkSession) -> None:
+    spark_session.stop()
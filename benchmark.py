@@ -0,0 +1,487 @@
+from analyzer import analysis_engines
+from analyzer_local import execute_local_analysis
+from configparser import ConfigParser
+from contextlib import redirect_stdout
+from csv import DictWriter
+from datetime import datetime
+from estimator_parallel import estimate_result, estimate_total_number_of_diffs, evaluation_modes, \
+    execute_estimation, format_result_line, generate_sequences_indices_list, parallel_task, \
+    parse_estimator_config, write_csv_file_header
+from io import StringIO
+from math import ceil
+from pathlib import Path
+from platform import python_version
+from shutil import rmtree
+from statistics import mean, median
+from sys import argv
+from time import perf_counter, time
+from typing import Callable, List, Optional
+
+benchmark_result_field_names = ["Timestamp",
+                                "Version",
+                                "Python Version",
+                                "Benchmark",
+                                "Parameters",
+                                "Repetitions",
+                                "Number of Rows",
+                                "Minimum Time (s)",
+                                "Median Time (s)",
+                                "Mean Time (s)",
+                                "Rows per Second"]
+analyzer_input_formats = ["csv", "parquet"]
+
+
+def check_if_has_valid_number_of_arguments(argv_list: list) -> None:
+    number_of_arguments_expected = 1
+    arguments_expected_list = ["benchmark_config_file"]
+    number_of_arguments_provided = len(argv_list) - 1
+    if number_of_arguments_provided != number_of_arguments_expected:
+        number_of_arguments_expected_message = \
+            "".join([str(number_of_arguments_expected),
+                     " arguments were" if number_of_arguments_expected > 1 else " argument was"])
+        number_of_arguments_provided_message = \
+            "".join([str(number_of_arguments_provided),
+                     " arguments were" if number_of_arguments_provided > 1 else " argument was"])
+        invalid_number_of_arguments_message = \
+            "Invalid number of arguments provided!\n" \
+            "{0} expected: {1}\n" \
+            "{2} provided: {3}".format(number_of_arguments_expected_message,
+                                       ", ".join(arguments_expected_list),
+                                       number_of_arguments_provided_message,
+                                       ", ".join(argv_list[1:]))
+        raise ValueError(invalid_number_of_arguments_message)
+
+
+def check_if_file_exists(file_path: Path) -> None:
+    if not file_path.is_file():
+        file_not_found_message = "'{0}' not found. The application will halt!".format(str(file_path))
+        raise FileNotFoundError(file_not_found_message)
+
+
+def parse_integer_list(integer_list: str) -> List[int]:
+    return [int(integer.strip()) for integer in integer_list.split(",") if integer.strip()]
+
+
+def parse_string_list(string_list: str) -> List[str]:
+    return [string.strip() for string in string_list.split(",") if string.strip()]
+
+
+def check_if_are_valid_options(option_name: str,
+                               provided_options: List[str],
+                               expected_options: List[str]) -> None:
+    for provided_option in provided_options:
+        if provided_option not in expected_options:
+            invalid_option_message = \
+                "Invalid {0} provided!\n" \
+                "Expected one of: {1}\n" \
+                "Provided: {2}".format(option_name,
+                                       ", ".join(expected_options),
+                                       provided_option)
+            raise ValueError(invalid_option_message)
+
+
+def parse_benchmark_config(benchmark_config_file: Path) -> List:
+    config_parser = ConfigParser()
+    config_parser.optionxform = str
+    config_parser.read(benchmark_config_file,
+                       encoding="utf-8")
+    benchmark_results_file = config_parser.get("Output Settings",
+                                               "benchmark_results_file")
+    benchmark_directory = config_parser.get("Output Settings",
+                                            "benchmark_directory")
+    estimator_config_file = Path(config_parser.get("General Settings",
+                                                   "estimator_config_file"))
+    check_if_file_exists(estimator_config_file)
+    repetitions = int(config_parser.get("General Settings",
+                                        "repetitions"))
+    sequences_indices_list_n_values = parse_integer_list(config_parser.get("Function Benchmark Settings",
+                                                                           "sequences_indices_list_n_values"))
+    estimate_total_number_of_diffs_n_values = \
+        parse_integer_list(config_parser.get("Function Benchmark Settings",
+                                             "estimate_total_number_of_diffs_n_values"))
+    parallel_task_n_values = parse_integer_list(config_parser.get("Function Benchmark Settings",
+                                                                  "parallel_task_n_values"))
+    n_upper_bounds = parse_integer_list(config_parser.get("Estimation Benchmark Settings",
+                                                          "n_upper_bounds"))
+    numbers_of_processes = parse_integer_list(config_parser.get("Estimation Benchmark Settings",
+                                                                "numbers_of_processes"))
+    benchmark_evaluation_modes = parse_string_list(config_parser.get("Estimation Benchmark Settings",
+                                                                     "evaluation_modes"))
+    check_if_are_valid_options("evaluation mode",
+                               benchmark_evaluation_modes,
+                               evaluation_modes)
+    numbers_of_rows = parse_integer_list(config_parser.get("Analyzer Benchmark Settings",
+                                                           "numbers_of_rows"))
+    input_formats = parse_string_list(config_parser.get("Analyzer Benchmark Settings",
+                                                        "input_formats"))
+    check_if_are_valid_options("input format",
+                               input_formats,
+                               analyzer_input_formats)
+    benchmark_analysis_engines = parse_string_list(config_parser.get("Analyzer Benchmark Settings",
+                                                                     "analysis_engines"))
+    check_if_are_valid_options("analysis engine",
+                               benchmark_analysis_engines,
+                               analysis_engines)
+    benchmark_config = [benchmark_results_file,
+                        benchmark_directory,
+                        parse_estimator_config(estimator_config_file),
+                        repetitions,
+                        sequences_indices_list_n_values,
+                        estimate_total_number_of_diffs_n_values,
+                        parallel_task_n_values,
+                        n_upper_bounds,
+                        numbers_of_processes,
+                        benchmark_evaluation_modes,
+                        numbers_of_rows,
+                        input_formats,
+                        benchmark_analysis_engines]
+    return benchmark_config
+
+
+def read_version() -> str:
+    config_parser = ConfigParser()
+    with open(file=Path(__file__).parent.joinpath("VERSION"), mode="r") as version_file:
+        config_parser.read_string("[Version]\n" + version_file.read())
+    version = "{0}.{1}.{2}".format(config_parser.get("Version", "major"),
+                                   config_parser.get("Version", "minor"),
+                                   config_parser.get("Version", "patch"))
+    pre_release = config_parser.get("Version", "pre_release")
+    return version + "-" + pre_release if pre_release else version
+
+
+def time_function(function: Callable,
+                  repetitions: int) -> List[float]:
+    # Wall Clock Time of Each Repetition, Silencing What the Function Prints
+    durations = []
+    for _ in range(repetitions):
+        with redirect_stdout(StringIO()):
+            begin_time = perf_counter()
+            function()
+            end_time = perf_counter()
+        durations.append(end_time - begin_time)
+    return durations
+
+
+def write_benchmark_results_file_header(benchmark_results_file: Path) -> None:
+    with open(file=benchmark_results_file, mode="w", newline="") as csv_file:
+        csv_writer = DictWriter(f=csv_file,
+                                fieldnames=benchmark_result_field_names)
+        csv_writer.writeheader()
+
+
+def append_benchmark_result(benchmark_results_file: Path,
+                            benchmark_run: List,
+                            benchmark_name: str,
+                            benchmark_parameters: str,
+                            number_of_rows: int,
+                            durations: List[float]) -> None:
+    minimum_duration = min(durations)
+    benchmark_result = [benchmark_run[0],
+                        benchmark_run[1],
+                        benchmark_run[2],
+                        benchmark_name,
+                        benchmark_parameters,
+                        len(durations),
+                        number_of_rows,
+                        minimum_duration,
+                        median(durations),
+                        mean(durations),
+                        number_of_rows / minimum_duration if minimum_duration > 0 else ""]
+    with open(file=benchmark_results_file, mode="a", newline="") as csv_file:
+        csv_writer = DictWriter(f=csv_file,
+                                fieldnames=benchmark_result_field_names)
+        csv_writer.writerow(dict(zip(benchmark_result_field_names, benchmark_result)))
+    print("{0} [{1}]: {2} s (Minimum of {3})".format(benchmark_name,
+                                                     benchmark_parameters,
+                                                     round(minimum_duration, 6),
+                                                     len(durations)))
+
+
+def benchmark_generate_sequences_indices_list(benchmark_results_file: Path,
+                                              benchmark_run: List,
+                                              repetitions: int,
+                                              n_values: List[int]) -> None:
+    # max_s = 1 Builds the Largest List (One Batch per Pair)
+    for n in n_values:
+        durations = time_function(lambda: generate_sequences_indices_list(n, 1),
+                                  repetitions)
+        append_benchmark_result(benchmark_results_file,
+                                benchmark_run,
+                                "generate_sequences_indices_list",
+                                "n={0};max_s=1".format(n),
+                                n * (n - 1) // 2,
+                                durations)
+
+
+def benchmark_estimate_total_number_of_diffs(benchmark_results_file: Path,
+                                             benchmark_run: List,
+                                             repetitions: int,
+                                             n_values: List[int]) -> None:
+    for n in n_values:
+        durations = time_function(lambda: [estimate_total_number_of_diffs(n, max_s) for max_s in range(1, n)],
+                                  repetitions)
+        append_benchmark_result(benchmark_results_file,
+                                benchmark_run,
+                                "estimate_total_number_of_diffs",
+                                "n={0};max_s=1..{1}".format(n, n - 1),
+                                n - 1,
+                                durations)
+
+
+def benchmark_parallel_task(benchmark_results_file: Path,
+                            benchmark_run: List,
+                            repetitions: int,
+                            n_values: List[int],
+                            estimator_config: List) -> None:
+    # One In-Process Task Covering Every max_s of n, Formatted as CSV Lines
+    n_range_per_output_file = estimator_config[4]
+    actual_d_a_engine = estimator_config[6]
+    for n in n_values:
+        durations = time_function(lambda: parallel_task(n_range_per_output_file,
+                                                        actual_d_a_engine,
+                                                        0,
+                                                        "csv",
+                                                        False,
+                                                        [],
+                                                        None,
+                                                        [(n, 1, n)]),
+                                  repetitions)
+        append_benchmark_result(benchmark_results_file,
+                                benchmark_run,
+                                "parallel_task",
+                                "n={0};actual_d_a_engine={1}".format(n, actual_d_a_engine),
+                                n - 1,
+                                durations)
+
+
+def benchmark_execute_estimation(benchmark_results_file: Path,
+                                 benchmark_run: List,
+                                 repetitions: int,
+                                 n_upper_bounds: List[int],
+                                 numbers_of_processes: List[int],
+                                 benchmark_evaluation_modes: List[str],
+                                 estimator_config: List,
+                                 benchmark_directory_path: Path) -> None:
+    for n_upper_bound in n_upper_bounds:
+        for number_of_processes in numbers_of_processes:
+            for evaluation_mode in benchmark_evaluation_modes:
+                # Fresh (Not Resumed), Unsharded and Exhaustive Run Over [2, n_upper_bound] With All max_s,
+                # Without Progress Lines or Task Metrics
+                benchmark_estimator_config = list(estimator_config)
+                benchmark_estimator_config[0] = str(benchmark_directory_path.joinpath("estimator_output"))
+                benchmark_estimator_config[1] = number_of_processes
+                benchmark_estimator_config[2] = 2
+                benchmark_estimator_config[3] = n_upper_bound
+                benchmark_estimator_config[5] = 1
+                benchmark_estimator_config[8] = evaluation_mode
+                if evaluation_mode == "vectorized":
+                    # The vectorized Mode Counts by the Closed Form Only
+                    benchmark_estimator_config[6] = "closed_form"
+                benchmark_estimator_config[13] = False
+                benchmark_estimator_config[18] = 0
+                benchmark_estimator_config[19] = False
+                benchmark_estimator_config[20] = 0
+                benchmark_estimator_config[21] = 1
+                benchmark_estimator_config[22] = "exhaustive"
+                durations = time_function(lambda: execute_estimation(benchmark_estimator_config),
+                                          repetitions)
+                append_benchmark_result(benchmark_results_file,
+                                        benchmark_run,
+                                        "execute_estimation",
+                                        "n_upper_bound={0};number_of_processes={1};evaluation_mode={2};"
+                                        "output_format={3};actual_d_a_engine={4};max_s_tile_size={5};"
+                                        "vectorized_n_tile_size={6};scheduling_policy={7}"
+                                        .format(n_upper_bound,
+                                                number_of_processes,
+                                                evaluation_mode,
+                                                estimator_config[15],
+                                                benchmark_estimator_config[6],
+                                                estimator_config[11],
+                                                estimator_config[9],
+                                                estimator_config[12]),
+                                        n_upper_bound * (n_upper_bound - 1) // 2,
+                                        durations)
+
+
+def generate_analyzer_dataset(analyzer_dataset_path: Path,
+                              input_format: str,
+                              number_of_rows: int) -> None:
+    # Estimator Rows of Consecutive n (Every max_s) Until number_of_rows Rows, in Files of 1000 n Each
+    analyzer_dataset_path.mkdir(parents=True)
+    results_by_output_file_index = {}
+    number_of_results = 0
+    n = 2
+    while number_of_results < number_of_rows:
+        output_file_results = results_by_output_file_index.setdefault(ceil(n / 1000) - 1, [])
+        for max_s in range(1, min(n, number_of_rows - number_of_results + 1)):
+            output_file_results.append(estimate_result(n,
+                                                       max_s,
+                                                       "closed_form",
+                                                       0))
+            number_of_results = number_of_results + 1
+        n = n + 1
+    for output_file_index, output_file_results in results_by_output_file_index.items():
+        if input_format == "parquet":
+            from estimator_parquet import build_result_table, get_parquet_partition_path, write_parquet_file
+            from pyarrow.compute import equal, unique
+            result_table = build_result_table([list(result_column) for result_column in zip(*output_file_results)],
+                                              [])
+            for max_s_case in unique(result_table["max_s_case"]).to_pylist():
+                write_parquet_file([result_table.filter(equal(result_table["max_s_case"], max_s_case))],
+                                   get_parquet_partition_path(analyzer_dataset_path,
+                                                              max_s_case,
+                                                              output_file_index + 1),
+                                   0,
+                                   0)
+        else:
+            output_csv_file_path = analyzer_dataset_path.joinpath("part_" + str(output_file_index + 1) + ".csv")
+            write_csv_file_header(output_csv_file_path,
+                                  [])
+            with open(file=output_csv_file_path, mode="a") as csv_file:
+                csv_file.write("".join([format_result_line(result) for result in output_file_results]))
+
+
+def create_benchmark_spark_session() -> Optional[object]:
+    # Local SparkSession (local[*], No Cluster), or None With a Notice When pyspark or Java Is Unavailable
+    try:
+        from analyzer_spark import create_spark_conf, get_or_create_spark_session, \
+            get_spark_context_from_spark_session
+    except ImportError as import_error:
+        print("Spark Analyzer Benchmarks Skipped (pyspark Unavailable: {0})".format(str(import_error)))
+        return None
+    try:
+        spark_session = get_or_create_spark_session(create_spark_conf([("spark.master", "local[*]"),
+                                                                       ("spark.app.name", "D_a Estimator Benchmark"),
+                                                                       ("spark.ui.enabled", "false")]))
+    except RuntimeError as runtime_error:
+        print("Spark Analyzer Benchmarks Skipped (Java Unavailable: {0})".format(str(runtime_error)))
+        return None
+    get_spark_context_from_spark_session(spark_session).setLogLevel("WARN")
+    return spark_session
+
+
+def benchmark_analyzer(benchmark_results_file: Path,
+                       benchmark_run: List,
+                       repetitions: int,
+                       numbers_of_rows: List[int],
+                       input_formats: List[str],
+                       benchmark_analysis_engines: List[str],
+                       benchmark_directory_path: Path) -> None:
+    # Without Cache, So Every Repetition Aggregates the Whole Dataset. The spark Engine Runs on a Local SparkSession
+    # (Created Once, Before Any Timing, So Only the Analysis Itself Is Timed)
+    spark_session = None
+    if "spark" in benchmark_analysis_engines:
+        spark_session = create_benchmark_spark_session()
+    for number_of_rows in numbers_of_rows:
+        for input_format in input_formats:
+            analyzer_dataset_path = benchmark_directory_path.joinpath("analyzer_{0}_{1}".format(input_format,
+                                                                                                number_of_rows))
+            generate_analyzer_dataset(analyzer_dataset_path,
+                                      input_format,
+                                      number_of_rows)
+            analyzer_config = [str(analyzer_dataset_path),
+                               input_format,
+                               [],
+                               [],
+                               False,
+                               "local",
+                               "",
+                               []]
+            if "local" in benchmark_analysis_engines:
+                durations = time_function(lambda: execute_local_analysis(analyzer_config),
+                                          repetitions)
+                append_benchmark_result(benchmark_results_file,
+                                        benchmark_run,
+                                        "execute_local_analysis",
+                                        "input_format={0}".format(input_format),
+                                        number_of_rows,
+                                        durations)
+            if spark_session is not None:
+                from analyzer_spark import execute_analysis
+                spark_analyzer_config = list(analyzer_config)
+                spark_analyzer_config[5] = "spark"
+                durations = time_function(lambda: execute_analysis(spark_session,
+                                                                   spark_analyzer_config),
+                                          repetitions)
+                append_benchmark_result(benchmark_results_file,
+                                        benchmark_run,
+                                        "execute_analysis",
+                                        "input_format={0};spark.master=local[*]".format(input_format),
+                                        number_of_rows,
+                                        durations)
+    if spark_session is not None:
+        from analyzer_spark import stop_spark_session
+        stop_spark_session(spark_session)
+
+
+def run_benchmarks(argv_list: list) -> None:
+    # Begin
+    begin_time = time()
+    # Print Application Start Notice
+    print("D_a Estimator Benchmark Application Started!")
+    # Check if Has Valid Number of Arguments
+    check_if_has_valid_number_of_arguments(argv_list)
+    # Read Benchmark Config File
+    benchmark_config_file = Path(argv_list[1])
+    # Check If Benchmark Config File Exists
+    check_if_file_exists(benchmark_config_file)
+    # Parse Benchmark Config
+    benchmark_results_file, benchmark_directory, estimator_config, repetitions, sequences_indices_list_n_values, \
+        estimate_total_number_of_diffs_n_values, parallel_task_n_values, n_upper_bounds, numbers_of_processes, \
+        benchmark_evaluation_modes, numbers_of_rows, input_formats, benchmark_analysis_engines = \
+        parse_benchmark_config(benchmark_config_file)
+    # Set Benchmark Run (Timestamp, Version and Python Version Shared by All Results of This Run)
+    benchmark_run = [datetime.now().isoformat(timespec="seconds"),
+                     read_version(),
+                     python_version()]
+    # Write Benchmark Results File Header (If Not Exists Yet)
+    benchmark_results_file = Path(benchmark_results_file)
+    if not benchmark_results_file.is_file():
+        write_benchmark_results_file_header(benchmark_results_file)
+    # Recreate Benchmark Directory
+    benchmark_directory_path = Path(benchmark_directory)
+    rmtree(benchmark_directory_path, ignore_errors=True)
+    benchmark_directory_path.mkdir(parents=True)
+    # Run Function Benchmarks
+    benchmark_generate_sequences_indices_list(benchmark_results_file,
+                                              benchmark_run,
+                                              repetitions,
+                                              sequences_indices_list_n_values)
+    benchmark_estimate_total_number_of_diffs(benchmark_results_file,
+                                             benchmark_run,
+                                             repetitions,
+                                             estimate_total_number_of_diffs_n_values)
+    benchmark_parallel_task(benchmark_results_file,
+                            benchmark_run,
+                            repetitions,
+                            parallel_task_n_values,
+                            estimator_config)
+    # Run Full Estimation Benchmarks
+    benchmark_execute_estimation(benchmark_results_file,
+                                 benchmark_run,
+                                 repetitions,
+                                 n_upper_bounds,
+                                 numbers_of_processes,
+                                 benchmark_evaluation_modes,
+                                 estimator_config,
+                                 benchmark_directory_path)
+    # Run Analyzer Benchmarks
+    benchmark_analyzer(benchmark_results_file,
+                       benchmark_run,
+                       repetitions,
+                       numbers_of_rows,
+                       input_formats,
+                       benchmark_analysis_engines,
+                       benchmark_directory_path)
+    # Remove Benchmark Directory
+    rmtree(benchmark_directory_path, ignore_errors=True)
+    # Print Application End Notice
+    print("D_a Estimator Benchmark Application Finished Successfully!")
+    end_time = time()
+    print("Duration Time: {0} seconds.".format(end_time - begin_time))
+    # End
+    exit(0)
+
+
+if __name__ == "__main__":
+    run_benchmarks(argv)
@@ -0,0 +1,240 @@
+from csv import writer
+from math import inf, sqrt
+from pathlib import Path
+from typing import List
+
+# Mergeable Error Statistics of One max_S Case:
+# [Number of Combinations, Number of Errors-Free Occurrences, Number of Erroneous Occurrences,
+#  Relative Error Moments, Percent Error Moments], Where Each Moments List Is [Minimum, Maximum, Mean, M2]
+# (M2 = Sum of Squared Deviations From the Mean, Updated With Welford's Algorithm and Merged With Chan's)
+
+
+def create_error_statistics() -> list:
+    return [0, 0, 0, [inf, -inf, 0.0, 0.0], [inf, -inf, 0.0, 0.0]]
+
+
+def update_moments(moments: list,
+                   number_of_values: int,
+                   value: float) -> None:
+    # number_of_values Includes the New Value
+    moments[0] = min(moments[0], value)
+    moments[1] = max(moments[1], value)
+    delta = value - moments[2]
+    moments[2] = moments[2] + delta / number_of_values
+    moments[3] = moments[3] + delta * (value - moments[2])
+
+
+def update_error_statistics(error_statistics: list,
+                            relative_error: float,
+                            percent_error: float) -> None:
+    error_statistics[0] = error_statistics[0] + 1
+    if relative_error == 0.0:
+        error_statistics[1] = error_statistics[1] + 1
+        return
+    error_statistics[2] = error_statistics[2] + 1
+    update_moments(error_statistics[3],
+                   error_statistics[2],
+                   relative_error)
+    update_moments(error_statistics[4],
+                   error_statistics[2],
+                   percent_error)
+
+
+def merge_moments(moments: list,
+                  number_of_values: int,
+                  other_moments: list,
+                  other_number_of_values: int) -> list:
+    merged_number_of_values = number_of_values + other_number_of_values
+    if merged_number_of_values == 0:
+        return [inf, -inf, 0.0, 0.0]
+    delta = other_moments[2] - moments[2]
+    merged_mean = moments[2] + delta * other_number_of_values / merged_number_of_values
+    merged_m2 = moments[3] + other_moments[3] \
+        + delta * delta * number_of_values * other_number_of_values / merged_number_of_values
+    return [min(moments[0], other_moments[0]),
+            max(moments[1], other_moments[1]),
+            merged_mean,
+            merged_m2]
+
+
+def merge_error_statistics(error_statistics: list,
+                           other_error_statistics: list) -> list:
+    return [error_statistics[0] + other_error_statistics[0],
+            error_statistics[1] + other_error_statistics[1],
+            error_statistics[2] + other_error_statistics[2],
+            merge_moments(error_statistics[3],
+                          error_statistics[2],
+                          other_error_statistics[3],
+                          other_error_statistics[2]),
+            merge_moments(error_statistics[4],
+                          error_statistics[2],
+                          other_error_statistics[4],
+                          other_error_statistics[2])]
+
+
+def merge_error_statistics_by_max_s_range(error_statistics_by_max_s_range: dict,
+                                          other_error_statistics_by_max_s_range: dict) -> None:
+    for range_case, other_error_statistics in other_error_statistics_by_max_s_range.items():
+        error_statistics_by_max_s_range[range_case] = \
+            merge_error_statistics(error_statistics_by_max_s_range.get(range_case, create_error_statistics()),
+                                   other_error_statistics)
+
+
+def weight_error_statistics_by_stratum(error_statistics_by_stratum: dict,
+                                       stratum_weights: dict) -> dict:
+    # Stratified Sample Estimates per max_S Bounds: Each (max_S Bounds, n Decade) Stratum Counts Its Sampled Rows
+    # weight (Population Size / Sample Size) Times, So Chan's Merge Yields Population-Weighted Means and M2.
+    # Counts Are Rounded to the Estimated Population Counts
+    weighted_error_statistics_by_max_s_range = {}
+    for (range_case, n_decade), error_statistics in sorted(error_statistics_by_stratum.items()):
+        weight = stratum_weights.get((range_case, n_decade), 1.0)
+        weighted_error_statistics = [error_statistics[0] * weight,
+                                     error_statistics[1] * weight,
+                                     error_statistics[2] * weight,
+                                     error_statistics[3][:3] + [error_statistics[3][3] * weight],
+                                     error_statistics[4][:3] + [error_statistics[4][3] * weight]]
+        weighted_error_statistics_by_max_s_range[range_case] = \
+            merge_error_statistics(weighted_error_statistics_by_max_s_range.get(range_case, create_error_statistics()),
+                                   weighted_error_statistics)
+    for weighted_error_statistics in weighted_error_statistics_by_max_s_range.values():
+        for count_index in [0, 1, 2]:
+            weighted_error_statistics[count_index] = round(weighted_error_statistics[count_index])
+    return weighted_error_statistics_by_max_s_range
+
+
+def print_stratified_sample_header() -> None:
+    print("----------------------------------")
+    print("STRATIFIED SAMPLE: Error Statistics Weighted by Stratum Population Size / Sample Size")
+
+
+def get_standard_deviation(moments: list,
+                           number_of_values: int):
+    # Sample Standard Deviation, Like Spark's stddev (None for Fewer Than Two Values)
+    if number_of_values < 2:
+        return None
+    return sqrt(moments[3] / (number_of_values - 1))
+
+
+def get_analysis_report_lists(error_statistics_by_max_s_range: dict) -> List:
+    # Returns the Arguments of print_analysis_report, With max_S Ranges Sorted by Label
+    total_number_of_combinations = 0
+    errors_free_by_max_s_range_list = []
+    errors_by_max_s_range_list = []
+    for range_case, error_statistics in sorted(error_statistics_by_max_s_range.items()):
+        total_number_of_combinations = total_number_of_combinations + error_statistics[0]
+        if error_statistics[1] > 0:
+            errors_free_by_max_s_range_list.append([range_case, error_statistics[1]])
+        if error_statistics[2] > 0:
+            relative_error_moments = error_statistics[3]
+            percent_error_moments = error_statistics[4]
+            errors_by_max_s_range_list.append([range_case,
+                                               error_statistics[2],
+                                               relative_error_moments[0],
+                                               relative_error_moments[1],
+                                               relative_error_moments[2],
+                                               get_standard_deviation(relative_error_moments,
+                                                                      error_statistics[2]),
+                                               percent_error_moments[0],
+                                               percent_error_moments[1],
+                                               percent_error_moments[2],
+                                               get_standard_deviation(percent_error_moments,
+                                                                      error_statistics[2])])
+    return [total_number_of_combinations, errors_free_by_max_s_range_list, errors_by_max_s_range_list]
+
+
+def write_error_statistics_summary_file(summary_file: Path,
+                                        error_statistics_by_max_s_range: dict) -> None:
+    # Unrounded Counterpart of print_analysis_report, One Row per max_S Bounds
+    with open(file=summary_file, mode="w", newline="") as csv_file:
+        csv_writer = writer(csv_file)
+        csv_writer.writerow(["max_S Bounds",
+                             "Number of Combinations",
+                             "Number of Errors-Free Occurrences",
+                             "Number of Occurrences",
+                             "Minimum Relative Error",
+                             "Maximum Relative Error",
+                             "Average Relative Error",
+                             "Standard Deviation of Relative Errors",
+                             "Minimum Percent Error",
+                             "Maximum Percent Error",
+                             "Average Percent Error",
+                             "Standard Deviation of Percent Errors"])
+        for range_case, error_statistics in sorted(error_statistics_by_max_s_range.items()):
+            summary_row = [range_case,
+                           error_statistics[0],
+                           error_statistics[1],
+                           error_statistics[2]]
+            for moments in [error_statistics[3], error_statistics[4]]:
+                if error_statistics[2] > 0:
+                    summary_row.extend(moments[:3])
+                else:
+                    summary_row.extend(["", "", ""])
+                standard_deviation = get_standard_deviation(moments,
+                                                            error_statistics[2])
+                summary_row.append("" if standard_deviation is None else standard_deviation)
+            csv_writer.writerow(summary_row)
+
+
+def round_or_none(value,
+                  number_of_digits: int):
+    # The Standard Deviation of a Single Erroneous Occurrence Is None (Null on Spark), Printed as Is
+    if value is None:
+        return None
+    return round(value, number_of_digits)
+
+
+def print_candidate_estimator_formula_header(estimator_formula_name: str) -> None:
+    print("----------------------------------")
+    print("CANDIDATE ESTIMATOR FORMULA: {0}".format(estimator_formula_name))
+
+
+def print_analysis_report(total_number_of_combinations: int,
+                          errors_free_by_max_s_range_list: List,
+                          errors_by_max_s_range_list: List) -> None:
+    print("----------------------------------")
+    print("TOTAL NUMBER OF COMBINATIONS: {0}".format(total_number_of_combinations))
+    print("----------------------------------")
+    print("ESTIMATION ERRORS-FREE ANALYSIS:")
+    for errors_free_by_max_s_range in errors_free_by_max_s_range_list:
+        range_case = errors_free_by_max_s_range[0]
+        number_of_occurrences = errors_free_by_max_s_range[1]
+        result = "{0}:\n" \
+                 "\tNumber of Occurrences: {1}\n" \
+            .format(range_case,
+                    number_of_occurrences)
+        print(result)
+    print("----------------------------------")
+    print("ESTIMATION ERRORS ANALYSIS:")
+    for errors_by_max_s_range in errors_by_max_s_range_list:
+        range_case = errors_by_max_s_range[0]
+        number_of_occurrences = errors_by_max_s_range[1]
+        min_relative_error = errors_by_max_s_range[2]
+        max_relative_error = round(errors_by_max_s_range[3], 4)
+        average_relative_error = round(errors_by_max_s_range[4], 4)
+        standard_deviation_relative_error = round_or_none(errors_by_max_s_range[5], 4)
+        min_percent_error = errors_by_max_s_range[6]
+        max_percent_error = round(errors_by_max_s_range[7], 1)
+        average_percent_error = round(errors_by_max_s_range[8], 1)
+        standard_deviation_percent_error = round_or_none(errors_by_max_s_range[9], 1)
+        result = "{0}:\n" \
+                 "\tNumber of Occurrences: {1}\n" \
+                 "\tMinimum Relative Error: {2}\n" \
+                 "\tMaximum Relative Error: {3}\n" \
+                 "\tAverage Relative Error: {4}\n" \
+                 "\tStandard Deviation of Relative Errors: {5}\n" \
+                 "\tMinimum Percent Error: {6}\n" \
+                 "\tMaximum Percent Error: {7}\n" \
+                 "\tAverage Percent Error: {8}\n" \
+                 "\tStandard Deviation of Percent Errors: {9}\n" \
+                 .format(range_case,
+                         number_of_occurrences,
+                         min_relative_error,
+                         max_relative_error,
+                         average_relative_error,
+                         standard_deviation_relative_error,
+                         min_percent_error,
+                         max_percent_error,
+                         average_percent_error,
+                         standard_deviation_percent_error)
+        print(result)
+    print("----------------------------------")
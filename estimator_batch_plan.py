@@ -0,0 +1,146 @@
+from estimator_parallel import check_if_file_exists, count_sequences_indices_batches_by_closed_form
+from mmap import ACCESS_READ, mmap
+from pathlib import Path
+from struct import Struct
+from sys import argv
+from time import time
+from typing import List
+
+# Batch Plan File Layout (Little-Endian): Header [Magic, Format Version, n, max_s, Number of Batches], Followed by
+# One Fixed-Width Record per Batch [First Index, Second Range Start, Second Range End (Exclusive)], in the Same
+# Order as generate_sequences_indices_list, So Batch k Lives at Offset header_size + k * record_size
+batch_plan_magic = b"DABP"
+batch_plan_format_version = 1
+batch_plan_header_struct = Struct("<4sIqqq")
+batch_plan_record_struct = Struct("<qqq")
+
+
+def check_if_has_valid_number_of_arguments(argv_list: list) -> None:
+    number_of_arguments_expected = 3
+    arguments_expected_list = ["n", "max_s", "batch_plan_file"]
+    number_of_arguments_provided = len(argv_list) - 1
+    if number_of_arguments_provided != number_of_arguments_expected:
+        number_of_arguments_expected_message = \
+            "".join([str(number_of_arguments_expected),
+                     " arguments were" if number_of_arguments_expected > 1 else " argument was"])
+        number_of_arguments_provided_message = \
+            "".join([str(number_of_arguments_provided),
+                     " arguments were" if number_of_arguments_provided > 1 else " argument was"])
+        invalid_number_of_arguments_message = \
+            "Invalid number of arguments provided!\n" \
+            "{0} expected: {1}\n" \
+            "{2} provided: {3}".format(number_of_arguments_expected_message,
+                                       ", ".join(arguments_expected_list),
+                                       number_of_arguments_provided_message,
+                                       ", ".join(argv_list[1:]))
+        raise ValueError(invalid_number_of_arguments_message)
+
+
+def count_batch_plan_batches(n: int,
+                             max_s: int) -> int:
+    # Batch Count of a Pair Without Reading (or Writing) Its File
+    return count_sequences_indices_batches_by_closed_form(n,
+                                                          max_s)
+
+
+def write_batch_plan_file(n: int,
+                          max_s: int,
+                          batch_plan_file: Path) -> int:
+    # Stream the Records Row by Row (max_s < 1 Never Splits a Row), Writing to a Hidden File Renamed Once Complete
+    batch_size = max_s if max_s >= 1 else n
+    number_of_batches = count_batch_plan_batches(n,
+                                                 max_s)
+    temporary_batch_plan_file = batch_plan_file.with_name("." + batch_plan_file.name)
+    with open(file=temporary_batch_plan_file, mode="wb") as plan_file:
+        plan_file.write(batch_plan_header_struct.pack(batch_plan_magic,
+                                                      batch_plan_format_version,
+                                                      n,
+                                                      max_s,
+                                                      number_of_batches))
+        for first_data_structure_sequence_index in range(0, n - 1):
+            plan_file.write(b"".join([batch_plan_record_struct.pack(first_data_structure_sequence_index,
+                                                                    second_data_structure_first_sequence_index,
+                                                                    min(second_data_structure_first_sequence_index
+                                                                        + batch_size, n))
+                                      for second_data_structure_first_sequence_index
+                                      in range(first_data_structure_sequence_index + 1, n, batch_size)]))
+    temporary_batch_plan_file.replace(batch_plan_file)
+    return number_of_batches
+
+
+def open_batch_plan_file(batch_plan_file: Path) -> List:
+    # Returns [Memory Map, n, max_s, Number of Batches]. Close the Memory Map With close_batch_plan_file
+    check_if_file_exists(batch_plan_file)
+    with open(file=batch_plan_file, mode="rb") as plan_file:
+        batch_plan_map = mmap(plan_file.fileno(), 0, access=ACCESS_READ)
+    magic, format_version, n, max_s, number_of_batches = batch_plan_header_struct.unpack_from(batch_plan_map, 0)
+    expected_batch_plan_size = batch_plan_header_struct.size + number_of_batches * batch_plan_record_struct.size
+    if magic != batch_plan_magic \
+            or format_version != batch_plan_format_version \
+            or len(batch_plan_map) != expected_batch_plan_size:
+        batch_plan_map.close()
+        invalid_batch_plan_file_message = \
+            "Invalid batch plan file provided!\n" \
+            "Expected: {0} Format Version {1} File of {2} Bytes\n" \
+            "Provided: '{3}'".format(batch_plan_magic.decode("ascii"),
+                                     batch_plan_format_version,
+                                     expected_batch_plan_size,
+                                     str(batch_plan_file))
+        raise ValueError(invalid_batch_plan_file_message)
+    return [batch_plan_map, n, max_s, number_of_batches]
+
+
+def close_batch_plan_file(batch_plan: List) -> None:
+    batch_plan[0].close()
+
+
+def read_batch_plan_record(batch_plan: List,
+                           batch_index: int) -> tuple:
+    # O(1): (First Index, Second Range Start, Second Range End) of Batch batch_index
+    if not 0 <= batch_index < batch_plan[3]:
+        invalid_batch_index_message = "Invalid batch index provided: {0}. It must be in [0, {1})!" \
+            .format(batch_index,
+                    batch_plan[3])
+        raise IndexError(invalid_batch_index_message)
+    return batch_plan_record_struct.unpack_from(batch_plan[0],
+                                                batch_plan_header_struct.size
+                                                + batch_index * batch_plan_record_struct.size)
+
+
+def read_sequences_indices_batch(batch_plan: List,
+                                 batch_index: int) -> list:
+    # Batch batch_index in the [[First Index], [Second Indices]] Form of generate_sequences_indices_list
+    first_data_structure_sequence_index, second_data_structure_first_sequence_index, \
+        second_data_structure_last_sequence_index = read_batch_plan_record(batch_plan,
+                                                                           batch_index)
+    return [[first_data_structure_sequence_index],
+            list(range(second_data_structure_first_sequence_index,
+                       second_data_structure_last_sequence_index))]
+
+
+def export_batch_plan(argv_list: list) -> None:
+    # Begin
+    begin_time = time()
+    # Print Application Start Notice
+    print("D_a Batch Plan Exporter Application Started!")
+    # Check if Has Valid Number of Arguments
+    check_if_has_valid_number_of_arguments(argv_list)
+    # Read n, max_s and Batch Plan File Path
+    n = int(argv_list[1])
+    max_s = int(argv_list[2])
+    batch_plan_file = Path(argv_list[3])
+    # Write Batch Plan File
+    number_of_batches = write_batch_plan_file(n,
+                                              max_s,
+                                              batch_plan_file)
+    print("Number of Batches: {0}".format(number_of_batches))
+    # Print Application End Notice
+    print("D_a Batch Plan Exporter Application Finished Successfully!")
+    end_time = time()
+    print("Duration Time: {0} seconds.".format(end_time - begin_time))
+    # End
+    exit(0)
+
+
+if __name__ == "__main__":
+    export_batch_plan(argv)
@@ -0,0 +1,173 @@
+from configparser import ConfigParser
+from error_statistics import merge_error_statistics_by_max_s_range
+from os import fsync
+from pathlib import Path
+from typing import List, TextIO
+
+# Names Starting With "_" Are Skipped by Spark When Reading the Output Directory as a Dataset
+checkpoint_manifest_file_name = "_checkpoint_manifest.csv"
+checkpoint_settings_file_name = "_checkpoint_settings.cfg"
+checkpoint_statistics_file_name = "_checkpoint_statistics.csv"
+# Closes Each Checkpoint, So Tiles of a Checkpoint Interrupted Midway Are Discarded Together
+checkpoint_end_marker = "End of Checkpoint"
+
+
+def write_checkpoint_settings(output_directory_path: Path,
+                              checkpoint_settings: dict) -> None:
+    config_parser = ConfigParser()
+    config_parser.optionxform = str
+    config_parser["Checkpoint Settings"] = {setting_name: str(setting_value)
+                                            for setting_name, setting_value in checkpoint_settings.items()}
+    with open(file=output_directory_path.joinpath(checkpoint_settings_file_name), mode="w") as settings_file:
+        config_parser.write(settings_file)
+
+
+def check_if_checkpoint_settings_match(output_directory_path: Path,
+                                       checkpoint_settings: dict) -> None:
+    # Part Files Are Assigned by n Range and Tiles by Shard, So Resuming With a Different Layout Would Mix Them Up
+    # (Settings Missing From an Older Checkpoint Are Not Checked)
+    config_parser = ConfigParser()
+    config_parser.optionxform = str
+    config_parser.read(output_directory_path.joinpath(checkpoint_settings_file_name),
+                       encoding="utf-8")
+    for setting_name, setting_value in checkpoint_settings.items():
+        checkpointed_setting_value = config_parser.get("Checkpoint Settings",
+                                                       setting_name,
+                                                       fallback=str(setting_value))
+        if checkpointed_setting_value != str(setting_value):
+            checkpoint_settings_mismatch_message = \
+                "Cannot resume from '{0}'!\n" \
+                "Checkpointed {1}: {2}\n" \
+                "Provided {1}: {3}".format(str(output_directory_path),
+                                           setting_name,
+                                           checkpointed_setting_value,
+                                           setting_value)
+            raise ValueError(checkpoint_settings_mismatch_message)
+
+
+def write_checkpoint_manifest_header(checkpoint_manifest_file: Path) -> None:
+    with open(file=checkpoint_manifest_file, mode="w") as manifest_file:
+        manifest_file.write("n,max_S Begin,max_S End,Output File Index,Output File Size\n")
+
+
+def write_checkpoint_statistics_header(checkpoint_statistics_file: Path) -> None:
+    with open(file=checkpoint_statistics_file, mode="w") as statistics_file:
+        statistics_file.write("Checkpoint Index,max_S Case (or Stratum),"
+                              "Number of Combinations,Number of Errors-Free Occurrences,Number of Occurrences,"
+                              "Minimum Relative Error,Maximum Relative Error,"
+                              "Average Relative Error,M2 of Relative Errors,"
+                              "Minimum Percent Error,Maximum Percent Error,"
+                              "Average Percent Error,M2 of Percent Errors\n")
+
+
+def load_checkpoint_error_statistics(checkpoint_statistics_file: Path,
+                                     number_of_completed_checkpoints: int) -> dict:
+    # Merge the Error Statistics of the Completed Checkpoints per max_S Case, Rewriting the File Without the
+    # Lines of an Interrupted Checkpoint (Whose Index Will Be Reused)
+    error_statistics_by_max_s_case = {}
+    with open(file=checkpoint_statistics_file, mode="r") as statistics_file:
+        statistics_lines = statistics_file.readlines()
+    completed_statistics_lines = statistics_lines[:1]
+    for statistics_line in statistics_lines[1:]:
+        statistics_fields = statistics_line.rstrip("\n").split(",")
+        if len(statistics_fields) != 13 or int(statistics_fields[0]) >= number_of_completed_checkpoints:
+            continue
+        completed_statistics_lines.append(statistics_line)
+        error_statistics = [int(statistics_fields[2]),
+                            int(statistics_fields[3]),
+                            int(statistics_fields[4]),
+                            [float(statistics_field) for statistics_field in statistics_fields[5:9]],
+                            [float(statistics_field) for statistics_field in statistics_fields[9:13]]]
+        merge_error_statistics_by_max_s_range(error_statistics_by_max_s_case,
+                                              {int(statistics_fields[1]): error_statistics})
+    with open(file=checkpoint_statistics_file, mode="w") as statistics_file:
+        statistics_file.writelines(completed_statistics_lines)
+    return error_statistics_by_max_s_case
+
+
+def load_checkpoint_manifest(checkpoint_manifest_file: Path) -> List:
+    # Returns the Completed max_s Intervals of Each n, the Last Checkpointed Size of Each Output File,
+    # the Size of the Manifest Up to Its Last Completed Checkpoint and the Number of Completed Checkpoints
+    completed_max_s_intervals = {}
+    checkpointed_output_file_sizes = {}
+    checkpoint_entries = []
+    manifest_size = 0
+    number_of_completed_checkpoints = 0
+    with open(file=checkpoint_manifest_file, mode="rb") as manifest_file:
+        manifest_size = len(manifest_file.readline())
+        manifest_offset = manifest_size
+        for manifest_line in manifest_file:
+            manifest_offset = manifest_offset + len(manifest_line)
+            manifest_line = manifest_line.decode("utf-8")
+            if manifest_line != checkpoint_end_marker + "\n":
+                checkpoint_entries.append(manifest_line)
+                continue
+            for checkpoint_entry in checkpoint_entries:
+                n, max_s_begin, max_s_end, output_file_index, output_file_size = \
+                    (int(field) for field in checkpoint_entry.split(","))
+                completed_max_s_intervals.setdefault(n, []).append((max_s_begin, max_s_end))
+                checkpointed_output_file_sizes[output_file_index] = output_file_size
+            checkpoint_entries = []
+            manifest_size = manifest_offset
+            number_of_completed_checkpoints = number_of_completed_checkpoints + 1
+    return [completed_max_s_intervals, checkpointed_output_file_sizes, manifest_size, number_of_completed_checkpoints]
+
+
+def subtract_completed_tiles(tiles: list,
+                             completed_max_s_intervals: dict) -> list:
+    # Keep Only the Parts of Each (n, max_s_begin, max_s_end) Tile Not Yet Covered by a Completed Tile
+    missing_tiles = []
+    for n, max_s_begin, max_s_end in tiles:
+        for completed_max_s_begin, completed_max_s_end in sorted(completed_max_s_intervals.get(n, [])):
+            if completed_max_s_end <= max_s_begin or completed_max_s_begin >= max_s_end:
+                continue
+            if completed_max_s_begin > max_s_begin:
+                missing_tiles.append((n, max_s_begin, completed_max_s_begin))
+            max_s_begin = completed_max_s_end
+            if max_s_begin >= max_s_end:
+                break
+        if max_s_begin < max_s_end:
+            missing_tiles.append((n, max_s_begin, max_s_end))
+    return missing_tiles
+
+
+def truncate_to_checkpointed_size(output_file: Path,
+                                  checkpointed_output_file_size: int) -> None:
+    # Drop Whatever Was Written After the Last Completed Checkpoint (Rows of Tiles Not in the Manifest,
+    # Which Will Be Recomputed, or a Manifest Checkpoint Interrupted Midway)
+    with open(file=output_file, mode="r+b") as output_file_handle:
+        output_file_handle.truncate(checkpointed_output_file_size)
+
+
+def write_checkpoint(output_files: dict,
+                     pending_tiles: list,
+                     pending_error_statistics: dict,
+                     checkpoint_index: int,
+                     manifest_file: TextIO,
+                     statistics_file: TextIO) -> int:
+    # Make the Output Files and the Error Statistics Durable First, Then Record the Output File Sizes
+    # (0 if Not Kept Open, as for Parquet) and the Tiles They Now Fully Contain. Returns the Next Checkpoint Index
+    if not pending_tiles:
+        return checkpoint_index
+    output_file_sizes = {}
+    for output_file_index, output_file in output_files.items():
+        output_file.flush()
+        fsync(output_file.fileno())
+        output_file_sizes[output_file_index] = output_file.tell()
+    for max_s_case, error_statistics in sorted(pending_error_statistics.items()):
+        statistics_file.write(",".join([str(checkpoint_index), str(max_s_case)]
+                                       + [repr(statistic) for statistic in error_statistics[:3]]
+                                       + [repr(moment) for moment in error_statistics[3]]
+                                       + [repr(moment) for moment in error_statistics[4]]) + "\n")
+    statistics_file.flush()
+    fsync(statistics_file.fileno())
+    for output_file_index, tile in pending_tiles:
+        manifest_file.write("{0},{1},{2},{3},{4}\n".format(tile[0],
+                                                           tile[1],
+                                                           tile[2],
+                                                           output_file_index,
+                                                           output_file_sizes.get(output_file_index, 0)))
+    manifest_file.write(checkpoint_end_marker + "\n")
+    manifest_file.flush()
+    fsync(manifest_file.fileno())
+    return checkpoint_index + 1
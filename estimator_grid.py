@@ -0,0 +1,244 @@
+from error_statistics import merge_error_statistics_by_max_s_range
+from estimator_checkpoint import write_checkpoint
+from estimator_parallel import write_csv_file_header
+from estimator_vectorized import format_grid_result_lines
+from functools import lru_cache
+from math import ceil
+from mmap import ALLOCATIONGRANULARITY, mmap
+from numpy import arange, asarray, concatenate, cumsum, dtype, float64, int8, int64, maximum, ndarray, where
+from numpy.lib.format import open_memmap
+from os import O_RDONLY, close, fsync, open as open_descriptor
+from pathlib import Path
+from time import time
+from typing import Iterator, List
+
+# Triangular (n, max_s) Result Grid of One Shard: One Fixed-Width Record per Pair of the Shard's Tiles, Ordered by n
+# Then max_s (max_s From max_s_lower_bound to n - 1). The Grid Is the _result_grid.npy File (Loadable Zero-Copy With
+# numpy.load(..., mmap_mode="r"); the "_" Prefix Keeps Spark's CSV Reader Off It), Memory-Mapped by the Workers,
+# Which Write Their Rows Straight Into It, and by the Writer, Which Flushes the Rows of the Completed Tiles at Every
+# Checkpoint. Rows Not Evaluated Yet Keep n = 0
+result_grid_file_name = "_result_grid.npy"
+result_grid_csv_export_rows = 100000
+
+
+def get_result_grid_dtype(candidate_estimator_formula_names: List[str]) -> dtype:
+    # Same Columns as estimator_parquet.get_result_schema (Packed, No Padding Between Fields)
+    result_grid_fields = [("n", int64),
+                          ("max_s", int64),
+                          ("max_s_case", int8),
+                          ("actual_d_a", int64),
+                          ("estimated_d_a", int64),
+                          ("absolute_error", int64),
+                          ("relative_error", float64),
+                          ("percent_error", float64)]
+    for candidate_estimator_formula_name in candidate_estimator_formula_names:
+        result_grid_fields.extend([("estimated_d_a_" + candidate_estimator_formula_name, int64),
+                                   ("absolute_error_" + candidate_estimator_formula_name, int64),
+                                   ("relative_error_" + candidate_estimator_formula_name, float64),
+                                   ("percent_error_" + candidate_estimator_formula_name, float64)])
+    return dtype(result_grid_fields)
+
+
+@lru_cache(maxsize=1)
+def get_result_grid_row_offsets(n_lower_bound: int,
+                                n_upper_bound: int,
+                                max_s_lower_bound: int,
+                                max_s_tile_size: int,
+                                shard_index: int,
+                                number_of_shards: int) -> ndarray:
+    # Row of the First Pair of Every n in [n_lower_bound, n_upper_bound + 1] (the Last One Is the Number of Rows).
+    # Tile j of n (max_s From max_s_lower_bound + j * max_s_tile_size) Belongs to the Shard When (n + j) mod
+    # number_of_shards = shard_index (See estimator_parallel.select_shard_tiles), So the Shard Holds Every
+    # number_of_shards-th Tile of n From Tile (shard_index - n) mod number_of_shards, All Full But the Last One of n
+    n = arange(n_lower_bound, n_upper_bound + 1, dtype=int64)
+    number_of_full_tiles, last_tile_size = divmod(maximum(n - max_s_lower_bound, 0), max_s_tile_size)
+    first_shard_tile = (shard_index - n) % number_of_shards
+    number_of_rows = (number_of_full_tiles - first_shard_tile + number_of_shards - 1) // number_of_shards \
+        * max_s_tile_size \
+        + where(number_of_full_tiles % number_of_shards == first_shard_tile, last_tile_size, 0)
+    return concatenate([asarray([0], dtype=int64), cumsum(number_of_rows, dtype=int64)])
+
+
+def get_result_grid_row_indices(result_grid_layout: List,
+                                n,
+                                max_s):
+    # Row of Each (n, max_s) Pair of the Shard (Element-Wise Over ndarrays of n and max_s).
+    # Result Grid Layout: [Result Grid File, n Lower Bound, n Upper Bound, max_S Lower Bound, max_S Tile Size,
+    # Shard Index, Number of Shards]
+    _, n_lower_bound, _, max_s_lower_bound, max_s_tile_size, _, number_of_shards = result_grid_layout
+    max_s_position = max_s - max_s_lower_bound
+    return get_result_grid_row_offsets(*result_grid_layout[1:])[n - n_lower_bound] \
+        + max_s_position // max_s_tile_size // number_of_shards * max_s_tile_size \
+        + max_s_position % max_s_tile_size
+
+
+def count_result_grid_rows(result_grid_layout: List) -> int:
+    return int(get_result_grid_row_offsets(*result_grid_layout[1:])[-1])
+
+
+def sync_result_grid_file(result_grid_file: Path) -> None:
+    # A New Grid File (Header and Size) Must Be Durable Before Any Checkpoint Refers to Its Rows
+    for synced_path in [result_grid_file, result_grid_file.parent]:
+        file_descriptor = open_descriptor(synced_path, O_RDONLY)
+        try:
+            fsync(file_descriptor)
+        finally:
+            close(file_descriptor)
+
+
+def open_result_grid(result_grid_layout: List,
+                     candidate_estimator_formula_names: List[str],
+                     resume: bool) -> List:
+    # Returns [Memory Map, Offset of the Rows in the File, Result Grid View]. Creates a Zero-Filled Grid File (Every
+    # n = 0), or on Resume Reopens the Checkpointed One, Whose Rows of the Completed Tiles Are Kept. Release With
+    # close_result_grid
+    result_grid_file = Path(result_grid_layout[0])
+    result_grid_dtype = get_result_grid_dtype(candidate_estimator_formula_names)
+    number_of_rows = count_result_grid_rows(result_grid_layout)
+    if resume and not result_grid_file.is_file():
+        # Checkpoints Written by Another Output Format (Older Ones Do Not Record It) Have No Grid File to Resume
+        missing_result_grid_file_message = \
+            "Invalid result grid file provided!\n" \
+            "Expected: {0} (Written by the Resumed grid Run)\n" \
+            "Provided: No Such File".format(str(result_grid_file))
+        raise ValueError(missing_result_grid_file_message)
+    if resume:
+        result_grid = open_memmap(result_grid_file, mode="r")
+        if result_grid.dtype != result_grid_dtype or result_grid.shape != (number_of_rows,):
+            invalid_result_grid_file_message = \
+                "Invalid result grid file provided!\n" \
+                "Expected: {0} Rows of {1}\n" \
+                "Provided: {2} Rows of {3}".format(number_of_rows,
+                                                   result_grid_dtype,
+                                                   result_grid.shape[0],
+                                                   result_grid.dtype)
+            raise ValueError(invalid_result_grid_file_message)
+    else:
+        result_grid = open_memmap(result_grid_file, mode="w+", dtype=result_grid_dtype, shape=(number_of_rows,))
+    result_grid_offset = result_grid.offset
+    del result_grid
+    if not resume:
+        sync_result_grid_file(result_grid_file)
+    with open(file=result_grid_file, mode="r+b") as grid_file:
+        result_grid_memory_map = mmap(grid_file.fileno(), 0)
+    result_grid = ndarray((number_of_rows,),
+                          dtype=result_grid_dtype,
+                          buffer=result_grid_memory_map,
+                          offset=result_grid_offset)
+    return [result_grid_memory_map, result_grid_offset, result_grid]
+
+
+def close_result_grid(result_grid_memory_map: mmap) -> None:
+    # The Result Grid Views Must Be Dropped First (a Memory Map With Exported Buffers Cannot Be Closed)
+    result_grid_memory_map.close()
+
+
+def write_result_grid_rows(result_grid_layout: List,
+                           candidate_estimator_formula_names: List[str],
+                           result_columns: list) -> None:
+    # Worker Side: Map the Result Grid File and Scatter the Result Columns (n, max_s, Case Code, Actual Dₐ,
+    # Estimated Dₐ and Errors, Then the Candidates') Into Their Rows. The Rows Reach the File Through the Page Cache,
+    # and the Writer Flushes Them Once Their Tiles Are Checkpointed
+    result_grid = open_memmap(result_grid_layout[0], mode="r+")
+    n_column = asarray(result_columns[0], dtype=int64)
+    row_indices = get_result_grid_row_indices(result_grid_layout,
+                                              n_column,
+                                              asarray(result_columns[1], dtype=int64))
+    for field_name, result_column in zip(get_result_grid_dtype(candidate_estimator_formula_names).names,
+                                         result_columns):
+        result_grid[field_name][row_indices] = result_column
+    del result_grid
+
+
+def flush_result_grid_rows(result_grid_memory_map: mmap,
+                           result_grid_offset: int,
+                           result_grid: ndarray,
+                           result_grid_layout: List,
+                           tiles: list) -> None:
+    # Flush Only the Rows of the Given Tiles (Each a Contiguous Row Range), Merged Into Page-Aligned Byte Ranges of
+    # the Result Grid File (Whose Rows Start at result_grid_offset, After the .npy Header)
+    byte_ranges = []
+    for n, max_s_begin, max_s_end in sorted(tiles):
+        first_row = int(get_result_grid_row_indices(result_grid_layout, n, max_s_begin))
+        begin = result_grid_offset + first_row * result_grid.itemsize
+        end = result_grid_offset + (first_row + max_s_end - max_s_begin) * result_grid.itemsize
+        begin -= begin % ALLOCATIONGRANULARITY
+        if byte_ranges and begin <= byte_ranges[-1][1]:
+            byte_ranges[-1][1] = max(byte_ranges[-1][1], end)
+        else:
+            byte_ranges.append([begin, end])
+    for begin, end in byte_ranges:
+        result_grid_memory_map.flush(begin, end - begin)
+
+
+def write_grid_result_batches(result_batches: Iterator[list],
+                              result_grid_memory_map: mmap,
+                              result_grid_offset: int,
+                              result_grid: ndarray,
+                              result_grid_layout: List,
+                              checkpoint_manifest_file: Path,
+                              checkpoint_statistics_file: Path,
+                              checkpoint_interval: float,
+                              checkpoint_index: int) -> int:
+    # Single Writer: Rows Are Already in the Result Grid When Their Task Completes, So Only the Tiles and Error
+    # Statistics Arrive Here. Every Checkpoint Flushes the Rows of Its Tiles (Then Records the Tiles).
+    # Returns the Number of Completed Checkpoints
+    pending_tiles = []
+    pending_error_statistics = {}
+    last_checkpoint_time = time()
+    with open(file=checkpoint_manifest_file, mode="a") as manifest_file, \
+            open(file=checkpoint_statistics_file, mode="a") as statistics_file:
+        while True:
+            result_batch = next(result_batches, None)
+            if result_batch is not None:
+                output_file_index, _, task, error_statistics_by_max_s_case = result_batch
+                pending_tiles.extend([output_file_index, tile] for tile in task)
+                merge_error_statistics_by_max_s_range(pending_error_statistics,
+                                                      error_statistics_by_max_s_case)
+            if result_batch is None or time() - last_checkpoint_time >= checkpoint_interval:
+                flush_result_grid_rows(result_grid_memory_map,
+                                       result_grid_offset,
+                                       result_grid,
+                                       result_grid_layout,
+                                       [tile for _, tile in pending_tiles])
+                checkpoint_index = write_checkpoint({},
+                                                    pending_tiles,
+                                                    pending_error_statistics,
+                                                    checkpoint_index,
+                                                    manifest_file,
+                                                    statistics_file)
+                pending_tiles = []
+                pending_error_statistics = {}
+                last_checkpoint_time = time()
+            if result_batch is None:
+                break
+    return checkpoint_index
+
+
+def export_result_grid_to_csv_files(result_grid: ndarray,
+                                    result_grid_layout: List,
+                                    output_directory_path: Path,
+                                    n_range_per_output_file: int,
+                                    candidate_estimator_formula_names: List[str],
+                                    output_buffer_size: int) -> None:
+    # Write the Evaluated Rows as the part_N.csv Files of the csv Output Format (Each Holding a Fixed n Range,
+    # Which Is a Contiguous Row Range of the Grid), in Chunks of result_grid_csv_export_rows Rows
+    _, n_lower_bound, n_upper_bound = result_grid_layout[:3]
+    result_grid_row_offsets = get_result_grid_row_offsets(*result_grid_layout[1:])
+    for output_file_index in range(ceil(n_lower_bound / n_range_per_output_file) - 1,
+                                   ceil(n_upper_bound / n_range_per_output_file)):
+        first_n = max(n_lower_bound, output_file_index * n_range_per_output_file + 1)
+        last_n = min(n_upper_bound, (output_file_index + 1) * n_range_per_output_file)
+        first_row = int(result_grid_row_offsets[first_n - n_lower_bound])
+        last_row = int(result_grid_row_offsets[last_n + 1 - n_lower_bound])
+        output_csv_file_path = output_directory_path.joinpath("part_" + str(output_file_index + 1) + ".csv")
+        write_csv_file_header(output_csv_file_path,
+                              candidate_estimator_formula_names)
+        with open(file=output_csv_file_path, mode="a", buffering=output_buffer_size) as csv_file:
+            for chunk_first_row in range(first_row, last_row, result_grid_csv_export_rows):
+                result_grid_chunk = result_grid[chunk_first_row:min(chunk_first_row + result_grid_csv_export_rows,
+                                                                    last_row)]
+                result_grid_chunk = result_grid_chunk[result_grid_chunk["n"] != 0]
+                if result_grid_chunk.size > 0:
+                    csv_file.write(format_grid_result_lines([result_grid_chunk[field_name]
+                                                             for field_name in result_grid_chunk.dtype.names]))
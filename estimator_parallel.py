@@ -1,13 +1,26 @@
 from configparser import ConfigParser
 from csv import DictWriter
+from error_statistics import create_error_statistics, get_analysis_report_lists, \
+    merge_error_statistics_by_max_s_range, print_analysis_report, print_stratified_sample_header, \
+    update_error_statistics, weight_error_statistics_by_stratum, write_error_statistics_summary_file
+from estimator_checkpoint import check_if_checkpoint_settings_match, checkpoint_manifest_file_name, \
+    checkpoint_statistics_file_name, load_checkpoint_error_statistics, load_checkpoint_manifest, \
+    subtract_completed_tiles, truncate_to_checkpointed_size, write_checkpoint, write_checkpoint_manifest_header, \
+    write_checkpoint_settings, write_checkpoint_statistics_header
+from estimator_sampling import generate_sampled_tiles, get_stratum_labels, get_stratum_weights, \
+    group_sampled_tiles_into_tasks, key_error_statistics_by_stratum, sampling_strata_file_name, \
+    write_sampling_strata_file
 from functools import partial
+from itertools import islice
 from math import ceil
 from multiprocessing import Pool
+from os import getpid
 from pathlib import Path
+from resource import RUSAGE_SELF, getrusage
 from shutil import rmtree
 from sys import argv
 from time import time
-from typing import List
+from typing import Iterator, List
 
 
 def check_if_has_valid_number_of_arguments(argv_list: list) -> None:
@@ -44,6 +57,19 @@ def parse_estimator_config(estimator_config_file: Path) -> List:
                        encoding="utf-8")
     output_directory_path = config_parser.get("Output Settings",
                                               "output_directory")
+    output_buffer_size = int(config_parser.get("Output Settings",
+                                               "output_buffer_size"))
+    output_format = config_parser.get("Output Settings",
+                                      "output_format")
+    check_if_is_valid_output_format(output_format)
+    parquet_rows_per_file = int(config_parser.get("Output Settings",
+                                                  "parquet_rows_per_file"))
+    online_error_statistics = config_parser.getboolean("Output Settings",
+                                                       "online_error_statistics")
+    check_if_has_output(output_format,
+                        online_error_statistics)
+    grid_csv_export = config_parser.getboolean("Output Settings",
+                                               "grid_csv_export")
     number_of_processes = int(config_parser.get("General Settings",
                                                 "number_of_processes"))
     n_lower_bound = int(config_parser.get("General Settings",
@@ -54,16 +80,92 @@ def parse_estimator_config(estimator_config_file: Path) -> List:
                                                     "n_range_per_output_file"))
     max_s_lower_bound = int(config_parser.get("General Settings",
                                               "max_s_lower_bound"))
+    actual_d_a_engine = config_parser.get("Engine Settings",
+                                          "actual_d_a_engine")
+    check_if_is_valid_actual_d_a_engine(actual_d_a_engine)
+    reference_verification_interval = int(config_parser.get("Engine Settings",
+                                                            "reference_verification_interval"))
+    evaluation_mode = config_parser.get("Engine Settings",
+                                        "evaluation_mode")
+    check_if_is_valid_evaluation_mode(evaluation_mode)
+    check_if_is_vectorizable_actual_d_a_engine(actual_d_a_engine,
+                                               evaluation_mode)
+    vectorized_n_tile_size = int(config_parser.get("Engine Settings",
+                                                   "vectorized_n_tile_size"))
+    candidate_estimator_formula_names = [candidate_estimator_formula_name.strip()
+                                         for candidate_estimator_formula_name
+                                         in config_parser.get("Engine Settings",
+                                                              "candidate_estimator_formulas").split(",")
+                                         if candidate_estimator_formula_name.strip()]
+    check_if_are_valid_candidate_estimator_formulas(candidate_estimator_formula_names)
+    check_if_are_vectorizable_candidate_estimator_formulas(candidate_estimator_formula_names,
+                                                           evaluation_mode)
+    max_s_tile_size = int(config_parser.get("Scheduler Settings",
+                                            "max_s_tile_size"))
+    scheduling_policy = config_parser.get("Scheduler Settings",
+                                          "scheduling_policy")
+    check_if_is_valid_scheduling_policy(scheduling_policy)
+    resume = config_parser.getboolean("Checkpoint Settings",
+                                      "resume")
+    checkpoint_interval = float(config_parser.get("Checkpoint Settings",
+                                                  "checkpoint_interval"))
+    shard_index = int(config_parser.get("Shard Settings",
+                                        "shard_index"))
+    number_of_shards = int(config_parser.get("Shard Settings",
+                                             "number_of_shards"))
+    check_if_is_valid_shard(shard_index,
+                            number_of_shards)
+    sampling_mode = config_parser.get("Sampling Settings",
+                                      "sampling_mode")
+    check_if_is_valid_sampling_mode(sampling_mode)
+    check_if_is_dense_output(output_format,
+                             sampling_mode)
+    samples_per_stratum = int(config_parser.get("Sampling Settings",
+                                                "samples_per_stratum"))
+    sampling_seed = int(config_parser.get("Sampling Settings",
+                                          "sampling_seed"))
+    progress_interval = float(config_parser.get("Monitoring Settings",
+                                                "progress_interval"))
+    task_metrics = config_parser.getboolean("Monitoring Settings",
+                                            "task_metrics")
     estimator_config = [output_directory_path,
                         number_of_processes,
                         n_lower_bound,
                         n_upper_bound,
                         n_range_per_output_file,
-                        max_s_lower_bound]
+                        max_s_lower_bound,
+                        actual_d_a_engine,
+                        reference_verification_interval,
+                        evaluation_mode,
+                        vectorized_n_tile_size,
+                        output_buffer_size,
+                        max_s_tile_size,
+                        scheduling_policy,
+                        resume,
+                        checkpoint_interval,
+                        output_format,
+                        parquet_rows_per_file,
+                        online_error_statistics,
+                        progress_interval,
+                        task_metrics,
+                        shard_index,
+                        number_of_shards,
+                        sampling_mode,
+                        samples_per_stratum,
+                        sampling_seed,
+                        candidate_estimator_formula_names,
+                        grid_csv_export]
     return estimator_config
 
 
-def write_csv_file_header(output_csv_file: Path) -> None:
+def get_candidate_estimator_formula_field_names(candidate_estimator_formula_name: str) -> List[str]:
+    # Columns of a Candidate Estimator Formula, Following the Estimated Dₐ and Error Columns of the Default One
+    return ["{0} [{1}]".format(field_name, candidate_estimator_formula_name)
+            for field_name in ["Estimated D_a", "Absolute Error", "Relative Error", "Percent Error (%)"]]
+
+
+def write_csv_file_header(output_csv_file: Path,
+                          candidate_estimator_formula_names: List[str]) -> None:
     with open(file=output_csv_file, mode="w") as csv_file:
         header_field_names = ["n",
                               "max_S",
@@ -73,6 +175,8 @@ def write_csv_file_header(output_csv_file: Path) -> None:
                               "Absolute Error",
                               "Relative Error",
                               "Percent Error (%)"]
+        for candidate_estimator_formula_name in candidate_estimator_formula_names:
+            header_field_names.extend(get_candidate_estimator_formula_field_names(candidate_estimator_formula_name))
         csv_writer = DictWriter(f=csv_file,
                                 fieldnames=header_field_names)
         csv_writer.writeheader()
@@ -112,6 +216,186 @@ def generate_sequences_indices_list(n: int,
     return sequences_indices_list
 
 
+def generate_sequences_indices_batches(n: int,
+                                       max_s: int) -> Iterator[list]:
+    # Lazily Yield the Same [[First Index], [Second Indices]] Batches, in the Same Order,
+    # as generate_sequences_indices_list (max_s < 1 Never Splits a Row)
+    batch_size = max_s if max_s >= 1 else n
+    for first_data_structure_sequence_index in range(0, n - 1):
+        for second_data_structure_first_sequence_index in range(first_data_structure_sequence_index + 1,
+                                                                n,
+                                                                batch_size):
+            second_data_structure_last_sequence_index = min(second_data_structure_first_sequence_index + batch_size,
+                                                            n)
+            yield [[first_data_structure_sequence_index],
+                   list(range(second_data_structure_first_sequence_index,
+                              second_data_structure_last_sequence_index))]
+
+
+def generate_sequences_indices_batches_chunks(n: int,
+                                              max_s: int,
+                                              chunk_size: int) -> Iterator[list]:
+    # Lazily Yield Lists of Up to chunk_size Consecutive Batches of generate_sequences_indices_batches
+    if chunk_size < 1:
+        invalid_chunk_size_message = "Invalid chunk size provided: {0}. It must be at least 1!".format(chunk_size)
+        raise ValueError(invalid_chunk_size_message)
+    sequences_indices_batches = generate_sequences_indices_batches(n,
+                                                                   max_s)
+    sequences_indices_batches_chunk = list(islice(sequences_indices_batches, chunk_size))
+    while sequences_indices_batches_chunk:
+        yield sequences_indices_batches_chunk
+        sequences_indices_batches_chunk = list(islice(sequences_indices_batches, chunk_size))
+
+
+def count_sequences_indices_batches_by_closed_form(n: int,
+                                                  max_s: int) -> int:
+    # Each First Data Structure Sequence Index i Splits Its (n - 1 - i) Pairs Into ceil((n - 1 - i) / max_s) Batches,
+    # So Dₐ = Σ ceil(k / max_s) for k in [1, n - 1], Which Sums to Whole Blocks of max_s Rows Plus a Remainder
+    # (max_s < 1 Never Splits a Row, Just Like generate_sequences_indices_list)
+    batch_size = max_s if max_s >= 1 else n
+    number_of_rows = n - 1
+    if number_of_rows < 1:
+        return 0
+    whole_blocks, remaining_rows = divmod(number_of_rows, batch_size)
+    return batch_size * whole_blocks * (whole_blocks + 1) // 2 + remaining_rows * (whole_blocks + 1)
+
+
+def count_sequences_indices_batches_by_ceil_sum(n: int,
+                                                max_s: int) -> int:
+    # Sum the Number of Batches of Each First Data Structure Sequence Index (Row), Without Building Them
+    batch_size = max_s if max_s >= 1 else n
+    number_of_batches = 0
+    for number_of_second_data_structure_sequences in range(1, n):
+        number_of_batches = number_of_batches + -(-number_of_second_data_structure_sequences // batch_size)
+    return number_of_batches
+
+
+def count_sequences_indices_batches_by_list(n: int,
+                                            max_s: int) -> int:
+    # Reference Engine: Build the Full Sequences Indices List and Take Its Length
+    return len(generate_sequences_indices_list(n,
+                                               max_s))
+
+
+actual_d_a_engines = {"closed_form": count_sequences_indices_batches_by_closed_form,
+                      "ceil_sum": count_sequences_indices_batches_by_ceil_sum,
+                      "sequences_indices_list": count_sequences_indices_batches_by_list}
+
+
+def check_if_is_valid_actual_d_a_engine(actual_d_a_engine: str) -> None:
+    if actual_d_a_engine not in actual_d_a_engines:
+        invalid_actual_d_a_engine_message = \
+            "Invalid actual D_a engine provided!\n" \
+            "Expected one of: {0}\n" \
+            "Provided: {1}".format(", ".join(actual_d_a_engines.keys()),
+                                   actual_d_a_engine)
+        raise ValueError(invalid_actual_d_a_engine_message)
+
+
+output_formats = ["csv", "parquet", "grid", "none"]
+
+
+def check_if_is_valid_output_format(output_format: str) -> None:
+    if output_format not in output_formats:
+        invalid_output_format_message = \
+            "Invalid output format provided!\n" \
+            "Expected one of: {0}\n" \
+            "Provided: {1}".format(", ".join(output_formats),
+                                   output_format)
+        raise ValueError(invalid_output_format_message)
+
+
+def check_if_has_output(output_format: str,
+                        online_error_statistics: bool) -> None:
+    if output_format == "none" and not online_error_statistics:
+        no_output_message = \
+            "Invalid output settings provided!\n" \
+            "Expected: online_error_statistics = True (output_format = none writes no rows)\n" \
+            "Provided: online_error_statistics = {0}".format(online_error_statistics)
+        raise ValueError(no_output_message)
+
+
+def check_if_is_vectorizable_actual_d_a_engine(actual_d_a_engine: str,
+                                               evaluation_mode: str) -> None:
+    # The vectorized Mode Counts the Actual Dₐ of Whole Tiles by the Closed Form Only (the Other Engines Are Per-Pair)
+    if evaluation_mode == "vectorized" and actual_d_a_engine != "closed_form":
+        unvectorizable_actual_d_a_engine_message = \
+            "Invalid actual D_a engine provided!\n" \
+            "Expected: closed_form (evaluation_mode = vectorized counts by the closed form only)\n" \
+            "Provided: {0}".format(actual_d_a_engine)
+        raise ValueError(unvectorizable_actual_d_a_engine_message)
+
+
+def check_if_is_dense_output(output_format: str,
+                             sampling_mode: str) -> None:
+    # The Result Grid Holds Every (n, max_s) Pair, Which a Stratified Sample Would Leave Almost Empty
+    if output_format == "grid" and sampling_mode != "exhaustive":
+        sparse_grid_message = \
+            "Invalid output settings provided!\n" \
+            "Expected: sampling_mode = exhaustive (output_format = grid holds every (n, max_S) pair)\n" \
+            "Provided: sampling_mode = {0}".format(sampling_mode)
+        raise ValueError(sparse_grid_message)
+
+
+evaluation_modes = ["scalar", "vectorized"]
+
+
+def check_if_is_valid_evaluation_mode(evaluation_mode: str) -> None:
+    if evaluation_mode not in evaluation_modes:
+        invalid_evaluation_mode_message = \
+            "Invalid evaluation mode provided!\n" \
+            "Expected one of: {0}\n" \
+            "Provided: {1}".format(", ".join(evaluation_modes),
+                                   evaluation_mode)
+        raise ValueError(invalid_evaluation_mode_message)
+
+
+def calculate_actual_total_number_of_diffs(n: int,
+                                           max_s: int,
+                                           actual_d_a_engine: str) -> int:
+    return actual_d_a_engines[actual_d_a_engine](n,
+                                                 max_s)
+
+
+def is_sampled_for_reference_verification(n: int,
+                                          max_s: int,
+                                          reference_verification_interval: int) -> bool:
+    # Sample Pairs Along the (n + max_s) Diagonals, So Every n Gets Verified for Some max_s
+    if reference_verification_interval < 1:
+        return False
+    return (n + max_s) % reference_verification_interval == 0
+
+
+def verify_actual_total_number_of_diffs(n: int,
+                                        max_s: int,
+                                        actual_total_number_of_diffs: int) -> None:
+    reference_total_number_of_diffs = count_sequences_indices_batches_by_list(n,
+                                                                              max_s)
+    if actual_total_number_of_diffs != reference_total_number_of_diffs:
+        actual_d_a_mismatch_message = \
+            "Actual D_a engine mismatch for n = {0} and max_S = {1}!\n" \
+            "Engine result: {2}\n" \
+            "Reference result (sequences indices list): {3}".format(n,
+                                                                     max_s,
+                                                                     actual_total_number_of_diffs,
+                                                                     reference_total_number_of_diffs)
+        raise ValueError(actual_d_a_mismatch_message)
+
+
+max_s_case_labels = {1: "First Case [1 <= max_S < (n / 2)]",
+                     2: "Second Case [(n / 2) <= max_S < n]"}
+
+
+def get_case_of_max_s(n: int,
+                      max_s: int) -> int:
+    case_max_s = 0
+    if 1 <= max_s < (n / 2):
+        case_max_s = 1
+    elif (n / 2) <= max_s < n:
+        case_max_s = 2
+    return case_max_s
+
+
 def estimate_total_number_of_diffs(n: int,
                                    max_s: int) -> int:
     estimated_total_number_of_diffs = 0
@@ -122,6 +406,63 @@ def estimate_total_number_of_diffs(n: int,
     return int(estimated_total_number_of_diffs)
 
 
+def estimate_total_number_of_diffs_by_mean_ceiling(n: int,
+                                                   max_s: int) -> int:
+    # Candidate: ceil(k / max_s) Averages (k / max_s) + (max_s - 1) / (2 * max_s) Over k = 1..n - 1,
+    # So a Single Case Covers 1 <= max_s < n (Integer Ceiling, Exact for Any n)
+    estimated_total_number_of_diffs = 0
+    if 1 <= max_s < n:
+        estimated_total_number_of_diffs = -(-((n - 1) * (n + max_s - 1)) // (2 * max_s))
+    return estimated_total_number_of_diffs
+
+
+def estimate_total_number_of_diffs_by_first_case_only(n: int,
+                                                      max_s: int) -> int:
+    # Candidate: First Case Formula Over the Whole 1 <= max_s < n Range (No Second Case Boundary)
+    estimated_total_number_of_diffs = 0
+    if 1 <= max_s < n:
+        estimated_total_number_of_diffs = ceil((n / max_s) * ((n - 1) - ((n - max_s) / 2)))
+    return int(estimated_total_number_of_diffs)
+
+
+# Estimator Formula Registry: default Fills the Estimated Dₐ and Error Columns, the Candidates Listed in
+# candidate_estimator_formulas Are Evaluated Against the Same Actual Dₐ Into Their Own Columns
+estimator_formulas = {"default": estimate_total_number_of_diffs,
+                      "mean_ceiling": estimate_total_number_of_diffs_by_mean_ceiling,
+                      "first_case_only": estimate_total_number_of_diffs_by_first_case_only}
+
+
+def check_if_are_valid_candidate_estimator_formulas(candidate_estimator_formula_names: List[str]) -> None:
+    candidate_estimator_formulas = [estimator_formula_name for estimator_formula_name in estimator_formulas.keys()
+                                    if estimator_formula_name != "default"]
+    for candidate_estimator_formula_name in candidate_estimator_formula_names:
+        if candidate_estimator_formula_name not in candidate_estimator_formulas \
+                or candidate_estimator_formula_names.count(candidate_estimator_formula_name) > 1:
+            invalid_candidate_estimator_formula_message = \
+                "Invalid candidate estimator formula provided!\n" \
+                "Expected one of (Once Each): {0}\n" \
+                "Provided: {1}".format(", ".join(candidate_estimator_formulas),
+                                       candidate_estimator_formula_name)
+            raise ValueError(invalid_candidate_estimator_formula_message)
+
+
+def check_if_are_vectorizable_candidate_estimator_formulas(candidate_estimator_formula_names: List[str],
+                                                           evaluation_mode: str) -> None:
+    # The vectorized Mode Evaluates the Candidates by Their Grid Counterparts (estimator_vectorized.
+    # estimator_formulas_grid), Which Not Every Formula of estimator_formulas May Have
+    if evaluation_mode != "vectorized":
+        return
+    from estimator_vectorized import estimator_formulas_grid
+    for candidate_estimator_formula_name in candidate_estimator_formula_names:
+        if candidate_estimator_formula_name not in estimator_formulas_grid:
+            unvectorizable_candidate_estimator_formula_message = \
+                "Invalid candidate estimator formula provided!\n" \
+                "Expected one of (evaluation_mode = vectorized): {0}\n" \
+                "Provided: {1}".format(", ".join(estimator_formulas_grid.keys()),
+                                       candidate_estimator_formula_name)
+            raise ValueError(unvectorizable_candidate_estimator_formula_message)
+
+
 def calculate_absolute_error_of_total_number_of_diffs_estimation(estimated_total_number_of_diffs: int,
                                                                  actual_total_number_of_diffs: int) -> int:
     return estimated_total_number_of_diffs - actual_total_number_of_diffs
@@ -137,20 +478,24 @@ def calculate_percent_error_of_total_number_of_diffs_estimation(estimated_total_
     return ((estimated_total_number_of_diffs - actual_total_number_of_diffs) / actual_total_number_of_diffs) * 100
 
 
-def estimate_and_append_to_csv_file(n: int,
-                                    max_s: int,
-                                    output_csv_file: Path) -> None:
-    # Generate Sequences Indices List
-    sequences_indices_list = generate_sequences_indices_list(n,
-                                                             max_s)
+def estimate_result(n: int,
+                    max_s: int,
+                    actual_d_a_engine: str,
+                    reference_verification_interval: int) -> list:
     # Get Case of max_s
-    case_max_s = None
-    if 1 <= max_s < (n / 2):
-        case_max_s = "First Case [1 <= max_S < (n / 2)]"
-    elif (n / 2) <= max_s < n:
-        case_max_s = "Second Case [(n / 2) <= max_S < n]"
+    case_max_s = get_case_of_max_s(n,
+                                   max_s)
     # Get Actual Total Number of Diffs (Dₐ)
-    actual_d_a = len(sequences_indices_list)
+    actual_d_a = calculate_actual_total_number_of_diffs(n,
+                                                        max_s,
+                                                        actual_d_a_engine)
+    # Cross-Check Actual Dₐ Against the Sequences Indices List (If Sampled for Reference Verification)
+    if is_sampled_for_reference_verification(n,
+                                             max_s,
+                                             reference_verification_interval):
+        verify_actual_total_number_of_diffs(n,
+                                            max_s,
+                                            actual_d_a)
     # Estimate Total Number of Diffs (Dₐ Estimation)
     estimated_d_a = estimate_total_number_of_diffs(n,
                                                    max_s)
@@ -169,41 +514,464 @@ def estimate_and_append_to_csv_file(n: int,
                                                                                                actual_d_a)
     # Get Absolute Value (Modulus) of the Percent Error
     abs(d_a_estimation_percent_error)
-    # Append Result to Output CSV File
-    with open(file=output_csv_file, mode="a") as csv_file:
-        result_line = "{0},{1},{2},{3},{4},{5},{6},{7}\n".format(n,
-                                                                 max_s,
-                                                                 case_max_s,
-                                                                 actual_d_a,
-                                                                 estimated_d_a,
-                                                                 d_a_estimation_absolute_error,
-                                                                 d_a_estimation_relative_error,
-                                                                 d_a_estimation_percent_error)
-        csv_file.write(result_line)
-    # Delete Generated Sequences Indices List
-    del sequences_indices_list
+    return [n,
+            max_s,
+            case_max_s,
+            actual_d_a,
+            estimated_d_a,
+            d_a_estimation_absolute_error,
+            d_a_estimation_relative_error,
+            d_a_estimation_percent_error]
+
+
+def estimate_candidate_results(n: int,
+                               max_s: int,
+                               actual_d_a: int,
+                               candidate_estimator_formula_names: List[str]) -> list:
+    # Estimated Dₐ and Errors of Each Candidate Estimator Formula, Reusing the Actual Dₐ of estimate_result
+    candidate_results = []
+    for candidate_estimator_formula_name in candidate_estimator_formula_names:
+        estimated_d_a = estimator_formulas[candidate_estimator_formula_name](n,
+                                                                             max_s)
+        candidate_results.extend([estimated_d_a,
+                                  calculate_absolute_error_of_total_number_of_diffs_estimation(estimated_d_a,
+                                                                                               actual_d_a),
+                                  calculate_relative_error_of_total_number_of_diffs_estimation(estimated_d_a,
+                                                                                               actual_d_a),
+                                  calculate_percent_error_of_total_number_of_diffs_estimation(estimated_d_a,
+                                                                                              actual_d_a)])
+    return candidate_results
+
+
+def format_result_line(result: list) -> str:
+    # Any Trailing Candidate Estimator Formula Columns Are Formatted Like the Default Ones
+    result_fields = [result[0], result[1], max_s_case_labels.get(result[2])] + result[3:]
+    result_line = ",".join([str(result_field) for result_field in result_fields]) + "\n"
+    return result_line
 
 
 def parallel_task(*args):
-    n_upper_bound = args[0]
-    max_s_lower_bound = args[1]
-    n_range_per_output_file = args[2]
-    output_csv_file_list = args[3]
-    n = args[4]
-    output_file_index = ceil(n / n_range_per_output_file) - 1
-    output_csv_file = output_csv_file_list[output_file_index]
-    for max_s in range(max_s_lower_bound, n_upper_bound):
-        if max_s < n:  # Maximum Value for max_s = n - 1
-            estimate_and_append_to_csv_file(n,
-                                            max_s,
-                                            output_csv_file)
-        else:
-            break
+    n_range_per_output_file = args[0]
+    actual_d_a_engine = args[1]
+    reference_verification_interval = args[2]
+    output_format = args[3]
+    online_error_statistics = args[4]
+    candidate_estimator_formula_names = args[5]
+    result_grid_layout = args[6]
+    task = args[7]
+    task_begin_time = time()
+    output_file_index = ceil(task[0][0] / n_range_per_output_file) - 1
+    results = []
+    for n, max_s_begin, max_s_end in task:
+        for max_s in range(max_s_begin, max_s_end):
+            result = estimate_result(n,
+                                     max_s,
+                                     actual_d_a_engine,
+                                     reference_verification_interval)
+            result.extend(estimate_candidate_results(n,
+                                                     max_s,
+                                                     result[3],
+                                                     candidate_estimator_formula_names))
+            results.append(result)
+    if output_format == "parquet":
+        # Columnar Result Batch
+        result_batch = [list(result_column) for result_column in zip(*results)]
+    elif output_format == "grid":
+        from estimator_grid import write_result_grid_rows
+        # Write Rows Into the Result Grid File (Nothing Sent to the Output Writer)
+        write_result_grid_rows(result_grid_layout,
+                               candidate_estimator_formula_names,
+                               [list(result_column) for result_column in zip(*results)])
+        result_batch = None
+    elif output_format == "csv":
+        # CSV Result Batch
+        result_batch = "".join([format_result_line(result) for result in results])
+    else:
+        result_batch = None
+    # Aggregate Error Statistics per max_S Case
+    error_statistics_by_max_s_case = {}
+    if online_error_statistics:
+        for result in results:
+            error_statistics = error_statistics_by_max_s_case.get(result[2])
+            if error_statistics is None:
+                error_statistics = error_statistics_by_max_s_case[result[2]] = create_error_statistics()
+            update_error_statistics(error_statistics,
+                                    result[6],
+                                    result[7])
+    task_statistics = [getpid(), task_begin_time, time(), len(results), getrusage(RUSAGE_SELF).ru_maxrss]
+    # Send Result Batch to the Output Writer
+    return [output_file_index, result_batch, task, task_statistics, error_statistics_by_max_s_case]
+
+
+def parallel_vectorized_task(*args):
+    from estimator_vectorized import aggregate_grid_errors, evaluate_candidate_grid, evaluate_grid, \
+        format_grid_result_lines, generate_grid_pairs
+    n_range_per_output_file = args[0]
+    reference_verification_interval = args[1]
+    output_format = args[2]
+    online_error_statistics = args[3]
+    candidate_estimator_formula_names = args[4]
+    result_grid_layout = args[5]
+    task = args[6]
+    task_begin_time = time()
+    output_file_index = ceil(task[0][0] / n_range_per_output_file) - 1
+    # Evaluate All Tiles of the (n, max_s) Grid at Once
+    n_grid, max_s_grid = generate_grid_pairs(task)
+    grid = evaluate_grid(n_grid,
+                         max_s_grid)
+    grid.extend(evaluate_candidate_grid(n_grid,
+                                        max_s_grid,
+                                        grid[3],
+                                        candidate_estimator_formula_names))
+    # Cross-Check Actual Dₐ of the Pairs Sampled for Reference Verification
+    if reference_verification_interval >= 1:
+        sampled_indices = ((n_grid + max_s_grid) % reference_verification_interval == 0).nonzero()[0]
+        for sampled_index in sampled_indices.tolist():
+            verify_actual_total_number_of_diffs(int(n_grid[sampled_index]),
+                                                int(max_s_grid[sampled_index]),
+                                                int(grid[3][sampled_index]))
+    if output_format == "parquet":
+        # Columnar Result Batch
+        result_batch = grid
+    elif output_format == "grid":
+        from estimator_grid import write_result_grid_rows
+        # Write Rows Into the Result Grid File (Nothing Sent to the Output Writer)
+        write_result_grid_rows(result_grid_layout,
+                               candidate_estimator_formula_names,
+                               grid)
+        result_batch = None
+    elif output_format == "csv":
+        # CSV Result Batch
+        result_batch = format_grid_result_lines(grid)
+    else:
+        result_batch = None
+    # Aggregate Error Statistics per max_S Case
+    error_statistics_by_max_s_case = {}
+    if online_error_statistics:
+        error_statistics_by_max_s_case = aggregate_grid_errors(grid)
+    task_statistics = [getpid(), task_begin_time, time(), int(n_grid.size), getrusage(RUSAGE_SELF).ru_maxrss]
+    # Send Result Batch to the Output Writer
+    return [output_file_index, result_batch, task, task_statistics, error_statistics_by_max_s_case]
+
+
+def write_result_batches(result_batches: Iterator[list],
+                         output_csv_file_paths: dict,
+                         output_buffer_size: int,
+                         checkpoint_manifest_file: Path,
+                         checkpoint_statistics_file: Path,
+                         checkpoint_interval: float,
+                         checkpoint_index: int) -> int:
+    # Single Writer: Keep Each Output CSV File Open and Write Result Batches Through a Large Buffer,
+    # Checkpointing the Written Tiles to the Manifest Every checkpoint_interval Seconds.
+    # Returns the Number of Completed Checkpoints
+    output_csv_files = {}
+    pending_tiles = []
+    pending_error_statistics = {}
+    last_checkpoint_time = time()
+    try:
+        with open(file=checkpoint_manifest_file, mode="a") as manifest_file, \
+                open(file=checkpoint_statistics_file, mode="a") as statistics_file:
+            for output_file_index, result_lines, task, error_statistics_by_max_s_case in result_batches:
+                if result_lines is not None:
+                    if output_file_index not in output_csv_files:
+                        output_csv_files[output_file_index] = open(file=output_csv_file_paths[output_file_index],
+                                                                   mode="a",
+                                                                   buffering=output_buffer_size)
+                    output_csv_files[output_file_index].write(result_lines)
+                pending_tiles.extend([output_file_index, tile] for tile in task)
+                merge_error_statistics_by_max_s_range(pending_error_statistics,
+                                                      error_statistics_by_max_s_case)
+                if time() - last_checkpoint_time >= checkpoint_interval:
+                    checkpoint_index = write_checkpoint(output_csv_files,
+                                                        pending_tiles,
+                                                        pending_error_statistics,
+                                                        checkpoint_index,
+                                                        manifest_file,
+                                                        statistics_file)
+                    pending_tiles = []
+                    pending_error_statistics = {}
+                    last_checkpoint_time = time()
+            checkpoint_index = write_checkpoint(output_csv_files,
+                                                pending_tiles,
+                                                pending_error_statistics,
+                                                checkpoint_index,
+                                                manifest_file,
+                                                statistics_file)
+    finally:
+        for output_csv_file in output_csv_files.values():
+            output_csv_file.close()
+    return checkpoint_index
+
+
+def write_task_metrics_file_header(task_metrics_file: Path) -> None:
+    with open(file=task_metrics_file, mode="w") as metrics_file:
+        metrics_file.write("Worker,First n,Last n,Number of Tiles,Number of Rows,"
+                           "Task Begin Time,Task End Time,Duration (s),Rows per Second,Worker Peak Memory (KiB)\n")
+
+
+def format_task_metrics_line(task: list,
+                             task_statistics: list) -> str:
+    worker_id, task_begin_time, task_end_time, number_of_rows, worker_peak_memory = task_statistics
+    task_duration_time = task_end_time - task_begin_time
+    return "{0},{1},{2},{3},{4},{5},{6},{7},{8},{9}\n".format(worker_id,
+                                                              task[0][0],
+                                                              task[-1][0],
+                                                              len(task),
+                                                              number_of_rows,
+                                                              task_begin_time,
+                                                              task_end_time,
+                                                              task_duration_time,
+                                                              number_of_rows / max(task_duration_time, 1e-9),
+                                                              worker_peak_memory)
+
+
+def format_duration(duration_time: float) -> str:
+    minutes, seconds = divmod(int(duration_time), 60)
+    hours, minutes = divmod(minutes, 60)
+    return "{0:d}:{1:02d}:{2:02d}".format(hours, minutes, seconds)
+
+
+def print_progress(number_of_tasks_done: int,
+                   number_of_tasks: int,
+                   number_of_rows_done: int,
+                   task_cost_done: int,
+                   total_task_cost: int,
+                   elapsed_time: float) -> None:
+    # ETA Extrapolates the Elapsed Time by the Estimated Cost Still Pending (Tasks Differ Widely in Cost)
+    progress_fraction = task_cost_done / total_task_cost if total_task_cost > 0 else 1.0
+    remaining_time = elapsed_time * (1 - progress_fraction) / progress_fraction if progress_fraction > 0 else 0.0
+    print("Progress: {0} % ({1}/{2} Tasks, {3} Rows) | {4} Rows/s | Elapsed: {5} | ETA: {6}"
+          .format(round(progress_fraction * 100, 1),
+                  number_of_tasks_done,
+                  number_of_tasks,
+                  number_of_rows_done,
+                  round(number_of_rows_done / max(elapsed_time, 1e-9), 1),
+                  format_duration(elapsed_time),
+                  format_duration(remaining_time)),
+          flush=True)
+
+
+def collect_task_statistics(task_results: Iterator[list],
+                            task_statistics_list: list,
+                            tasks_list: list,
+                            actual_d_a_engine: str,
+                            evaluation_mode: str,
+                            progress_interval: float,
+                            task_metrics_file) -> Iterator[list]:
+    # Strip Task Statistics From Task Results, Passing Result Batches Through to the Output Writer.
+    # Progress Is Printed Every progress_interval Seconds (0 = Disabled) and, Given a Task Metrics File,
+    # the Metrics of Each Task Are Appended to It
+    total_task_cost = sum(estimate_task_cost(task, actual_d_a_engine, evaluation_mode) for task in tasks_list)
+    task_cost_done = 0
+    number_of_rows_done = 0
+    collection_begin_time = time()
+    last_progress_time = collection_begin_time
+    metrics_file = open(file=task_metrics_file, mode="a") if task_metrics_file is not None else None
+    try:
+        for output_file_index, result_batch, task, task_statistics, error_statistics_by_max_s_case in task_results:
+            task_statistics_list.append(task_statistics)
+            if metrics_file is not None:
+                metrics_file.write(format_task_metrics_line(task,
+                                                            task_statistics))
+            task_cost_done = task_cost_done + estimate_task_cost(task, actual_d_a_engine, evaluation_mode)
+            number_of_rows_done = number_of_rows_done + task_statistics[3]
+            if progress_interval > 0 and time() - last_progress_time >= progress_interval:
+                print_progress(len(task_statistics_list),
+                               len(tasks_list),
+                               number_of_rows_done,
+                               task_cost_done,
+                               total_task_cost,
+                               time() - collection_begin_time)
+                last_progress_time = time()
+            yield [output_file_index, result_batch, task, error_statistics_by_max_s_case]
+        if progress_interval > 0:
+            print_progress(len(task_statistics_list),
+                           len(tasks_list),
+                           number_of_rows_done,
+                           task_cost_done,
+                           total_task_cost,
+                           time() - collection_begin_time)
+    finally:
+        if metrics_file is not None:
+            metrics_file.close()
+
+
+def check_if_is_valid_shard(shard_index: int,
+                            number_of_shards: int) -> None:
+    if number_of_shards < 1 or not 0 <= shard_index < number_of_shards:
+        invalid_shard_message = \
+            "Invalid shard provided!\n" \
+            "Expected: number_of_shards >= 1 and 0 <= shard_index < number_of_shards\n" \
+            "Provided: shard_index = {0}, number_of_shards = {1}".format(shard_index,
+                                                                         number_of_shards)
+        raise ValueError(invalid_shard_message)
+
+
+def get_shard_output_directory_path(output_directory_path: Path,
+                                    shard_index: int,
+                                    number_of_shards: int) -> Path:
+    # Shards Write to Their Own shard=<Index> Subdirectory, Read Back as a Partition of One Dataset
+    if number_of_shards == 1:
+        return output_directory_path
+    return output_directory_path.joinpath("shard={0}".format(shard_index))
+
+
+def select_shard_tiles(tiles: list,
+                       max_s_lower_bound: int,
+                       max_s_tile_size: int,
+                       shard_index: int,
+                       number_of_shards: int) -> list:
+    # Each Tile Goes to Shard (n + Tile Position Within n) mod number_of_shards: the Split Depends Only on the
+    # Tile Itself (Not on the n Bounds), and Neighboring Tiles (of Similar Cost) Go to Different Shards
+    return [tile for tile in tiles
+            if (tile[0] + (tile[1] - max_s_lower_bound) // max_s_tile_size) % number_of_shards == shard_index]
+
+
+sampling_modes = ["exhaustive", "stratified"]
+
+
+def check_if_is_valid_sampling_mode(sampling_mode: str) -> None:
+    if sampling_mode not in sampling_modes:
+        invalid_sampling_mode_message = \
+            "Invalid sampling mode provided!\n" \
+            "Expected one of: {0}\n" \
+            "Provided: {1}".format(", ".join(sampling_modes),
+                                   sampling_mode)
+        raise ValueError(invalid_sampling_mode_message)
+
+
+def generate_tiles(n_range_list: list,
+                   n_upper_bound: int,
+                   max_s_lower_bound: int,
+                   max_s_tile_size: int) -> list:
+    # Split Each n Into (n, max_s_begin, max_s_end) Tiles of Up to max_s_tile_size Consecutive max_s
+    tiles = []
+    for n in n_range_list:
+        max_s_end = min(n, n_upper_bound)  # Maximum Value for max_s = n - 1
+        for max_s_begin in range(max_s_lower_bound, max_s_end, max_s_tile_size):
+            tiles.append((n, max_s_begin, min(max_s_begin + max_s_tile_size, max_s_end)))
+    return tiles
+
+
+def group_tiles_into_tasks(tiles: list,
+                           evaluation_mode: str,
+                           vectorized_n_tile_size: int,
+                           n_range_per_output_file: int) -> list:
+    # On scalar Mode, Each Tile Is a Task. On vectorized Mode, Consecutive Tiles Spanning Up to
+    # vectorized_n_tile_size Distinct n Are Grouped Into One Task, Never Crossing an Output File Boundary
+    if evaluation_mode != "vectorized":
+        return [[tile] for tile in tiles]
+    tasks = []
+    task = []
+    task_n_list = []
+    for tile in tiles:
+        n = tile[0]
+        if task and n != task_n_list[-1] \
+                and (len(task_n_list) == vectorized_n_tile_size
+                     or ceil(n / n_range_per_output_file) != ceil(task_n_list[0] / n_range_per_output_file)):
+            tasks.append(task)
+            task = []
+            task_n_list = []
+        task.append(tile)
+        if not task_n_list or n != task_n_list[-1]:
+            task_n_list.append(n)
+    if task:
+        tasks.append(task)
+    return tasks
+
+
+def estimate_task_cost(task: list,
+                       actual_d_a_engine: str,
+                       evaluation_mode: str) -> int:
+    # Relative Cost: Number of (n, max_s) Pairs, Weighted by the Per-Pair Cost of the Actual Dₐ Engine
+    task_cost = 0
+    for n, max_s_begin, max_s_end in task:
+        pair_cost = 1
+        if evaluation_mode != "vectorized":
+            if actual_d_a_engine == "ceil_sum":
+                pair_cost = n
+            elif actual_d_a_engine == "sequences_indices_list":
+                pair_cost = n * n
+        task_cost = task_cost + (max_s_end - max_s_begin) * pair_cost
+    return task_cost
+
+
+scheduling_policies = ["largest_first", "in_order"]
+
+
+def check_if_is_valid_scheduling_policy(scheduling_policy: str) -> None:
+    if scheduling_policy not in scheduling_policies:
+        invalid_scheduling_policy_message = \
+            "Invalid scheduling policy provided!\n" \
+            "Expected one of: {0}\n" \
+            "Provided: {1}".format(", ".join(scheduling_policies),
+                                   scheduling_policy)
+        raise ValueError(invalid_scheduling_policy_message)
+
+
+def schedule_tasks(tasks: list,
+                   actual_d_a_engine: str,
+                   evaluation_mode: str,
+                   scheduling_policy: str) -> list:
+    # largest_first Hands the Most Expensive Tasks Out First (Pool Workers Pull One Task at a Time),
+    # So the Cheap Ones Fill the Gaps at the End of the Run
+    if scheduling_policy == "largest_first":
+        return sorted(tasks,
+                      key=lambda task: estimate_task_cost(task,
+                                                          actual_d_a_engine,
+                                                          evaluation_mode),
+                      reverse=True)
+    return tasks
+
+
+def report_worker_utilization(task_statistics_list: list,
+                              pool_begin_time: float,
+                              pool_end_time: float) -> None:
+    pool_duration_time = max(pool_end_time - pool_begin_time, 1e-9)
+    workers_statistics = {}
+    for worker_id, task_begin_time, task_end_time, number_of_rows, worker_peak_memory in task_statistics_list:
+        worker_statistics = workers_statistics.setdefault(worker_id, [0, 0.0, pool_begin_time, 0, 0])
+        worker_statistics[0] = worker_statistics[0] + 1
+        worker_statistics[1] = worker_statistics[1] + (task_end_time - task_begin_time)
+        worker_statistics[2] = max(worker_statistics[2], task_end_time)
+        worker_statistics[3] = worker_statistics[3] + number_of_rows
+        worker_statistics[4] = max(worker_statistics[4], worker_peak_memory)
+    print("----------------------------------")
+    print("WORKER UTILIZATION:")
+    for worker_id, (number_of_tasks, busy_time, last_task_end_time, number_of_rows, worker_peak_memory) \
+            in sorted(workers_statistics.items()):
+        result = "Worker {0}:\n" \
+                 "\tNumber of Tasks: {1}\n" \
+                 "\tBusy Time: {2} seconds\n" \
+                 "\tUtilization: {3} %\n" \
+                 "\tIdle Time at the End: {4} seconds\n" \
+                 "\tRows per Second: {5}\n" \
+                 "\tPeak Memory: {6} MiB\n" \
+            .format(worker_id,
+                    number_of_tasks,
+                    round(busy_time, 3),
+                    round((busy_time / pool_duration_time) * 100, 1),
+                    round(max(pool_end_time - last_task_end_time, 0.0), 3),
+                    round(number_of_rows / max(busy_time, 1e-9), 1),
+                    round(worker_peak_memory / 1024, 1))
+        print(result)
+    print("----------------------------------")
+
+
+estimation_summary_file_name = "_estimation_summary.csv"
+task_metrics_file_name = "_task_metrics.csv"
 
 
 def execute_estimation(estimator_config: List) -> None:
-    # Get Output Directory Path
-    output_directory_path = Path(estimator_config[0])
+    # Get Shard Index
+    shard_index = estimator_config[20]
+    # Get Number of Shards
+    number_of_shards = estimator_config[21]
+    print("Shard: {0} of {1}".format(shard_index + 1, number_of_shards))
+    # Get Output Directory Path (of This Shard)
+    output_directory_path = get_shard_output_directory_path(Path(estimator_config[0]),
+                                                            shard_index,
+                                                            number_of_shards)
     # Get Number of Processes
     number_of_processes = estimator_config[1]
     print("Number of Processes: {0}".format(number_of_processes))
@@ -215,36 +983,314 @@ def execute_estimation(estimator_config: List) -> None:
     n_range_per_output_file = estimator_config[4]
     # Get max_S Lower Bound
     max_s_lower_bound = estimator_config[5]
+    # Get Actual Dₐ Engine
+    actual_d_a_engine = estimator_config[6]
+    print("Actual D_a Engine: {0}".format(actual_d_a_engine))
+    # Get Reference Verification Interval
+    reference_verification_interval = estimator_config[7]
+    # Get Evaluation Mode
+    evaluation_mode = estimator_config[8]
+    print("Evaluation Mode: {0}".format(evaluation_mode))
+    # Get Vectorized n Tile Size
+    vectorized_n_tile_size = estimator_config[9]
+    # Get Output Buffer Size
+    output_buffer_size = estimator_config[10]
+    # Get max_S Tile Size
+    max_s_tile_size = estimator_config[11]
+    # Get Scheduling Policy
+    scheduling_policy = estimator_config[12]
+    print("Scheduling Policy: {0}".format(scheduling_policy))
+    # Get Resume
+    resume = estimator_config[13]
+    # Get Checkpoint Interval
+    checkpoint_interval = estimator_config[14]
+    # Get Output Format
+    output_format = estimator_config[15]
+    print("Output Format: {0}".format(output_format))
+    # Get Parquet Rows per File
+    parquet_rows_per_file = estimator_config[16]
+    # Get Online Error Statistics
+    online_error_statistics = estimator_config[17]
+    print("Online Error Statistics: {0}".format(online_error_statistics))
+    # Get Grid CSV Export
+    grid_csv_export = estimator_config[26]
+    # Get Candidate Estimator Formulas
+    candidate_estimator_formula_names = estimator_config[25]
+    print("Candidate Estimator Formulas: {0}".format(", ".join(candidate_estimator_formula_names) or "None"))
+    # Get Sampling Mode
+    sampling_mode = estimator_config[22]
+    print("Sampling Mode: {0}".format(sampling_mode))
+    # Get Samples per Stratum
+    samples_per_stratum = estimator_config[23]
+    # Get Sampling Seed
+    sampling_seed = estimator_config[24]
+    # Set Checkpoint Settings (Output Format and File Layout, Whether Checkpoints Hold Error Statistics and, When
+    # Sharded or Sampled, Tiles Split)
+    checkpoint_settings = {"output_format": output_format,
+                           "online_error_statistics": online_error_statistics,
+                           "n_range_per_output_file": n_range_per_output_file,
+                           "candidate_estimator_formulas": ",".join(candidate_estimator_formula_names)}
+    if sampling_mode == "stratified":
+        checkpoint_settings.update({"n_lower_bound": n_lower_bound,
+                                    "n_upper_bound": n_upper_bound,
+                                    "max_s_lower_bound": max_s_lower_bound,
+                                    "samples_per_stratum": samples_per_stratum,
+                                    "sampling_seed": sampling_seed})
+    if output_format == "grid":
+        checkpoint_settings.update({"n_lower_bound": n_lower_bound,
+                                    "n_upper_bound": n_upper_bound,
+                                    "max_s_lower_bound": max_s_lower_bound})
+    if number_of_shards > 1:
+        checkpoint_settings.update({"max_s_lower_bound": max_s_lower_bound,
+                                    "max_s_tile_size": max_s_tile_size,
+                                    "shard_index": shard_index,
+                                    "number_of_shards": number_of_shards})
+    # Get Progress Interval
+    progress_interval = estimator_config[18]
+    # Get Task Metrics
+    task_metrics = estimator_config[19]
     # Set n Range List
     n_range_list = list(range(n_lower_bound, n_upper_bound + 1))
     # print(n_range_list)
-    # Set Number of Output Files
-    number_of_output_files = ceil(len(n_range_list) / n_range_per_output_file)
-    print("Number of Output Files: {0}".format(number_of_output_files))
-    # Remove Output CSV Base Directory Path (If Already Exists)
-    rmtree(output_directory_path, ignore_errors=True)
-    # Create Output CSV Base Directory
-    output_directory_path.mkdir()
-    # Set Output CSV Files Path List
-    output_csv_file_list = []
-    for output_file_index in range(1, number_of_output_files + 1):
+    # Set Output File Indices (Each Output File Holds a Fixed n Range, So Widened Bounds Keep Existing Files)
+    output_file_indices = sorted(set(ceil(n / n_range_per_output_file) - 1 for n in n_range_list))
+    print("Number of Output Files: {0}".format(len(output_file_indices)))
+    # Set Checkpoint Manifest File Path
+    checkpoint_manifest_file = output_directory_path.joinpath(checkpoint_manifest_file_name)
+    # Set Checkpoint Statistics File Path
+    checkpoint_statistics_file = output_directory_path.joinpath(checkpoint_statistics_file_name)
+    completed_max_s_intervals = {}
+    checkpointed_output_file_sizes = {}
+    number_of_completed_checkpoints = 0
+    if resume and checkpoint_manifest_file.is_file():
+        print("Resuming From Checkpoint: {0}".format(str(checkpoint_manifest_file)))
+        # Check If Checkpoint Was Written With the Same Output File Layout
+        check_if_checkpoint_settings_match(output_directory_path,
+                                           checkpoint_settings)
+        # Load Completed Tiles and Checkpointed Output File Sizes
+        completed_max_s_intervals, checkpointed_output_file_sizes, checkpointed_manifest_size, \
+            number_of_completed_checkpoints = load_checkpoint_manifest(checkpoint_manifest_file)
+        # Drop an Interrupted Last Checkpoint From the Manifest
+        truncate_to_checkpointed_size(checkpoint_manifest_file,
+                                      checkpointed_manifest_size)
+        # Drop Error Statistics of an Interrupted Last Checkpoint
+        load_checkpoint_error_statistics(checkpoint_statistics_file,
+                                         number_of_completed_checkpoints)
+    else:
+        # Remove Output CSV Base Directory Path (If Already Exists)
+        rmtree(output_directory_path, ignore_errors=True)
+        # Create Output CSV Base Directory
+        output_directory_path.mkdir(parents=True)
+        # Write Checkpoint Settings and Manifest Header
+        write_checkpoint_settings(output_directory_path,
+                                  checkpoint_settings)
+        write_checkpoint_manifest_header(checkpoint_manifest_file)
+        write_checkpoint_statistics_header(checkpoint_statistics_file)
+    if output_format == "parquet":
+        from estimator_parquet import remove_uncheckpointed_parquet_files
+        # Drop Parquet Files Written After the Last Checkpoint
+        remove_uncheckpointed_parquet_files(output_directory_path,
+                                            number_of_completed_checkpoints)
+    # Set Output CSV Files Paths
+    output_csv_file_paths = {}
+    for output_file_index in output_file_indices:
+        if output_format != "csv":
+            break
         # Set Output CSV File Path
-        output_csv_file_path = output_directory_path.joinpath("part_" + str(output_file_index) + ".csv")
-        # Write Output CSV File Header
-        write_csv_file_header(output_csv_file_path)
-        # Append Output CSV File to List
-        output_csv_file_list.append(output_csv_file_path)
-    # Set Pool
-    pool = Pool(processes=number_of_processes)
-    # Set Partial Function
-    partial_function = partial(parallel_task,
+        output_csv_file_path = output_directory_path.joinpath("part_" + str(output_file_index + 1) + ".csv")
+        if output_file_index in checkpointed_output_file_sizes:
+            # Drop Rows Written After the Last Checkpoint
+            truncate_to_checkpointed_size(output_csv_file_path,
+                                          checkpointed_output_file_sizes[output_file_index])
+        else:
+            # Write Output CSV File Header
+            write_csv_file_header(output_csv_file_path,
+                                  candidate_estimator_formula_names)
+        # Add Output CSV File to Paths
+        output_csv_file_paths[output_file_index] = output_csv_file_path
+    if sampling_mode == "stratified":
+        # Draw the Stratified Sample of (n, max_s) Pairs as Tiles and Write the Strata Sizes
+        tiles, strata_sizes = generate_sampled_tiles(n_lower_bound,
+                                                     n_upper_bound,
+                                                     max_s_lower_bound,
+                                                     samples_per_stratum,
+                                                     sampling_seed)
+        write_sampling_strata_file(output_directory_path.joinpath(sampling_strata_file_name),
+                                   strata_sizes)
+        print("Number of Sampled Pairs: {0}".format(sum(stratum_sizes[4] for stratum_sizes in strata_sizes)))
+    else:
+        # Split the (n, max_s) Space Into Tiles
+        tiles = generate_tiles(n_range_list,
                                n_upper_bound,
                                max_s_lower_bound,
-                               n_range_per_output_file,
-                               output_csv_file_list)
-    # Start Map Pool
-    pool.map(partial_function,
-             n_range_list)
+                               max_s_tile_size)
+    # Keep the Tiles of This Shard, Skipping the Ones Already Completed
+    tiles = subtract_completed_tiles(select_shard_tiles(tiles,
+                                                        max_s_lower_bound,
+                                                        max_s_tile_size,
+                                                        shard_index,
+                                                        number_of_shards),
+                                     completed_max_s_intervals)
+    # Group Tiles Into Tasks
+    if sampling_mode == "stratified":
+        tasks_list = group_sampled_tiles_into_tasks(tiles,
+                                                    max_s_tile_size,
+                                                    n_range_per_output_file)
+    else:
+        tasks_list = group_tiles_into_tasks(tiles,
+                                            evaluation_mode,
+                                            vectorized_n_tile_size,
+                                            n_range_per_output_file)
+    # Schedule Tasks by Estimated Cost
+    tasks_list = schedule_tasks(tasks_list,
+                                actual_d_a_engine,
+                                evaluation_mode,
+                                scheduling_policy)
+    print("Number of Tasks: {0}".format(len(tasks_list)))
+    result_grid_memory_map = None
+    result_grid_layout = None
+    if output_format == "grid":
+        from estimator_grid import open_result_grid, result_grid_file_name
+        # Set Result Grid Layout (the Grid Holds Only the Rows of This Shard's Tiles)
+        result_grid_layout = [str(output_directory_path.joinpath(result_grid_file_name)),
+                              n_lower_bound,
+                              n_upper_bound,
+                              max_s_lower_bound,
+                              max_s_tile_size,
+                              shard_index,
+                              number_of_shards]
+        # Open Result Grid File (Workers Map It Too), Reusing the Rows of the Completed Tiles on Resume
+        result_grid_memory_map, result_grid_offset, result_grid = \
+            open_result_grid(result_grid_layout,
+                             candidate_estimator_formula_names,
+                             number_of_completed_checkpoints > 0)
+        print("Result Grid Size: {0} MiB".format(round(result_grid.nbytes / 1048576, 1)))
+    if evaluation_mode == "vectorized":
+        # Set Partial Function
+        partial_function = partial(parallel_vectorized_task,
+                                   n_range_per_output_file,
+                                   reference_verification_interval,
+                                   output_format,
+                                   online_error_statistics,
+                                   candidate_estimator_formula_names,
+                                   result_grid_layout)
+    else:
+        # Set Partial Function
+        partial_function = partial(parallel_task,
+                                   n_range_per_output_file,
+                                   actual_d_a_engine,
+                                   reference_verification_interval,
+                                   output_format,
+                                   online_error_statistics,
+                                   candidate_estimator_formula_names,
+                                   result_grid_layout)
+    # Set Task Metrics File Path (Appended to Across Resumed Runs)
+    task_metrics_file = None
+    if task_metrics:
+        task_metrics_file = output_directory_path.joinpath(task_metrics_file_name)
+        if not task_metrics_file.is_file():
+            write_task_metrics_file_header(task_metrics_file)
+    # Set Pool
+    task_statistics_list = []
+    pool_begin_time = time()
+    try:
+        with Pool(processes=number_of_processes) as pool:
+            # Start Unordered Map Pool (One Task per Worker Request), Sending Result Batches to the Output Writer
+            # as They Complete
+            result_batches = collect_task_statistics(pool.imap_unordered(partial_function,
+                                                                         tasks_list,
+                                                                         chunksize=1),
+                                                     task_statistics_list,
+                                                     tasks_list,
+                                                     actual_d_a_engine,
+                                                     evaluation_mode,
+                                                     progress_interval,
+                                                     task_metrics_file)
+            if sampling_mode == "stratified":
+                # Keep the Error Statistics per Stratum, to Weight Them at the End
+                result_batches = key_error_statistics_by_stratum(result_batches)
+            if output_format == "parquet":
+                from estimator_parquet import write_parquet_result_batches
+                number_of_completed_checkpoints = write_parquet_result_batches(result_batches,
+                                                                               output_directory_path,
+                                                                               parquet_rows_per_file,
+                                                                               candidate_estimator_formula_names,
+                                                                               checkpoint_manifest_file,
+                                                                               checkpoint_statistics_file,
+                                                                               checkpoint_interval,
+                                                                               number_of_completed_checkpoints)
+            elif output_format == "grid":
+                from estimator_grid import write_grid_result_batches
+                number_of_completed_checkpoints = write_grid_result_batches(result_batches,
+                                                                            result_grid_memory_map,
+                                                                            result_grid_offset,
+                                                                            result_grid,
+                                                                            result_grid_layout,
+                                                                            checkpoint_manifest_file,
+                                                                            checkpoint_statistics_file,
+                                                                            checkpoint_interval,
+                                                                            number_of_completed_checkpoints)
+            else:
+                number_of_completed_checkpoints = write_result_batches(result_batches,
+                                                                       output_csv_file_paths,
+                                                                       output_buffer_size,
+                                                                       checkpoint_manifest_file,
+                                                                       checkpoint_statistics_file,
+                                                                       checkpoint_interval,
+                                                                       number_of_completed_checkpoints)
+        pool_end_time = time()
+        if output_format == "grid" and grid_csv_export:
+            from estimator_grid import export_result_grid_to_csv_files
+            # Export the Result Grid as part_N.csv Files
+            export_result_grid_to_csv_files(result_grid,
+                                            result_grid_layout,
+                                            output_directory_path,
+                                            n_range_per_output_file,
+                                            candidate_estimator_formula_names,
+                                            output_buffer_size)
+    finally:
+        if result_grid_memory_map is not None:
+            from estimator_grid import close_result_grid
+            # Close the Result Grid File
+            result_grid = None
+            close_result_grid(result_grid_memory_map)
+    # Report Per-Worker Utilization
+    report_worker_utilization(task_statistics_list,
+                              pool_begin_time,
+                              pool_end_time)
+    if online_error_statistics and sampling_mode == "stratified":
+        # Merge the Error Statistics of All Checkpoints per Stratum (n Decade * 10 + max_S Case)
+        error_statistics_by_stratum = {}
+        for stratum_key, error_statistics in load_checkpoint_error_statistics(checkpoint_statistics_file,
+                                                                              number_of_completed_checkpoints).items():
+            error_statistics_by_stratum[(str(max_s_case_labels.get(stratum_key % 10)), stratum_key // 10)] = \
+                error_statistics
+        # Weight the Strata by Population Size / Sample Size
+        error_statistics_by_max_s_range = \
+            weight_error_statistics_by_stratum(error_statistics_by_stratum,
+                                               get_stratum_weights(strata_sizes,
+                                                                   max_s_case_labels))
+        # Print Estimation Summary
+        print_stratified_sample_header()
+        print_analysis_report(*get_analysis_report_lists(error_statistics_by_max_s_range))
+        # Write Estimation Summary File (Weighted Estimates per max_S Bounds, Then the Sample of Each Stratum)
+        stratum_labels = get_stratum_labels(strata_sizes,
+                                            max_s_case_labels)
+        error_statistics_by_max_s_range.update({stratum_labels[stratum]: error_statistics
+                                                for stratum, error_statistics in error_statistics_by_stratum.items()})
+        write_error_statistics_summary_file(output_directory_path.joinpath(estimation_summary_file_name),
+                                            error_statistics_by_max_s_range)
+    elif online_error_statistics:
+        # Merge the Error Statistics of All Checkpoints (Including the Ones of Resumed Runs) per max_S Bounds
+        error_statistics_by_max_s_range = {}
+        for max_s_case, error_statistics in load_checkpoint_error_statistics(checkpoint_statistics_file,
+                                                                             number_of_completed_checkpoints).items():
+            error_statistics_by_max_s_range[str(max_s_case_labels.get(max_s_case))] = error_statistics
+        # Print Estimation Summary
+        print_analysis_report(*get_analysis_report_lists(error_statistics_by_max_s_range))
+        # Write Estimation Summary File
+        write_error_statistics_summary_file(output_directory_path.joinpath(estimation_summary_file_name),
+                                            error_statistics_by_max_s_range)
 
 
 def estimate_parallel(argv_list: list) -> None:
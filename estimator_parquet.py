@@ -0,0 +1,154 @@
+from error_statistics import merge_error_statistics_by_max_s_range
+from estimator_checkpoint import write_checkpoint
+from os import O_RDONLY, close, fsync, open as open_descriptor
+from pathlib import Path
+from pyarrow import Schema, Table, array, concat_tables, field, float64, int8, int64, schema
+from pyarrow.compute import equal, unique
+from pyarrow.parquet import write_table
+from time import time
+from typing import Iterator, List
+
+max_s_case_partition_column = "max_s_case"
+n_range_partition_column = "n_range"
+result_schema = schema([field("n", int64(), nullable=False),
+                        field("max_s", int64(), nullable=False),
+                        field(max_s_case_partition_column, int8(), nullable=False),
+                        field("actual_d_a", int64(), nullable=False),
+                        field("estimated_d_a", int64(), nullable=False),
+                        field("absolute_error", int64(), nullable=False),
+                        field("relative_error", float64(), nullable=False),
+                        field("percent_error", float64(), nullable=False)])
+
+
+def get_result_schema(candidate_estimator_formula_names: List[str]) -> Schema:
+    # Candidate Estimator Formula Columns Are Suffixed by the Formula Name (Like estimated_d_a_mean_ceiling)
+    candidate_fields = []
+    for candidate_estimator_formula_name in candidate_estimator_formula_names:
+        for result_field in list(result_schema)[4:]:
+            candidate_fields.append(result_field.with_name("{0}_{1}".format(result_field.name,
+                                                                            candidate_estimator_formula_name)))
+    return schema(list(result_schema) + candidate_fields)
+
+
+def build_result_table(result_batch: list,
+                       candidate_estimator_formula_names: List[str]) -> Table:
+    # Result Batch Columns Follow estimate_result: n, max_s, Case Code, Actual Dₐ, Estimated Dₐ and Errors,
+    # Then the Estimated Dₐ and Errors of Each Candidate Estimator Formula
+    result_table_schema = get_result_schema(candidate_estimator_formula_names)
+    return Table.from_arrays([array(result_column, type=result_field.type)
+                              for result_column, result_field in zip(result_batch, result_table_schema)],
+                             schema=result_table_schema)
+
+
+def get_parquet_partition_path(output_directory_path: Path,
+                               max_s_case: int,
+                               n_range: int) -> Path:
+    return output_directory_path.joinpath("{0}={1}".format(max_s_case_partition_column, max_s_case),
+                                          "{0}={1}".format(n_range_partition_column, n_range))
+
+
+def write_parquet_file(partition_tables: list,
+                       partition_path: Path,
+                       checkpoint_index: int,
+                       file_sequence: int) -> Path:
+    # Partition Columns Live in the Directory Names, Not in the File. The File Is Written Under a Hidden Name
+    # (Skipped by Readers) and Renamed Once Complete. Returns the Path of the Written File
+    partition_path.mkdir(parents=True, exist_ok=True)
+    parquet_file_name = "part-{0:06d}-{1:06d}.parquet".format(checkpoint_index, file_sequence)
+    temporary_parquet_file_path = partition_path.joinpath("." + parquet_file_name)
+    write_table(concat_tables(partition_tables).drop([max_s_case_partition_column]),
+                temporary_parquet_file_path)
+    temporary_parquet_file_path.replace(partition_path.joinpath(parquet_file_name))
+    return partition_path.joinpath(parquet_file_name)
+
+
+def sync_parquet_files(parquet_file_paths: List[Path]) -> None:
+    # Make the Written Files and Their Renames Durable (fsync Each File, Then Each Partition Directory)
+    # Before the Checkpoint Records Their Tiles as Completed
+    for path in parquet_file_paths + sorted(set(parquet_file_path.parent for parquet_file_path in parquet_file_paths)):
+        file_descriptor = open_descriptor(path, O_RDONLY)
+        try:
+            fsync(file_descriptor)
+        finally:
+            close(file_descriptor)
+
+
+def remove_uncheckpointed_parquet_files(output_directory_path: Path,
+                                        number_of_completed_checkpoints: int) -> None:
+    # Files Are Named After the Checkpoint They Belong to, So Files of Unfinished Checkpoints Can Be Dropped
+    partition_glob = "{0}=*/{1}=*/".format(max_s_case_partition_column, n_range_partition_column)
+    for parquet_file_path in output_directory_path.glob(partition_glob + ".part-*.parquet"):
+        parquet_file_path.unlink()
+    for parquet_file_path in output_directory_path.glob(partition_glob + "part-*.parquet"):
+        if int(parquet_file_path.name.split("-")[1]) >= number_of_completed_checkpoints:
+            parquet_file_path.unlink()
+
+
+def write_parquet_result_batches(result_batches: Iterator[list],
+                                 output_directory_path: Path,
+                                 parquet_rows_per_file: int,
+                                 candidate_estimator_formula_names: List[str],
+                                 checkpoint_manifest_file: Path,
+                                 checkpoint_statistics_file: Path,
+                                 checkpoint_interval: float,
+                                 checkpoint_index: int) -> int:
+    # Single Writer: Buffer Result Batches per (max_s_case, n_range) Partition and Write Each Partition Buffer
+    # as One Parquet File Once It Reaches parquet_rows_per_file Rows, or at Every Checkpoint.
+    # Returns the Number of Completed Checkpoints
+    partition_buffers = {}
+    pending_parquet_files = []
+    pending_tiles = []
+    pending_error_statistics = {}
+    file_sequence = 0
+    last_checkpoint_time = time()
+    with open(file=checkpoint_manifest_file, mode="a") as manifest_file, \
+            open(file=checkpoint_statistics_file, mode="a") as statistics_file:
+        while True:
+            result_batch = next(result_batches, None)
+            if result_batch is not None:
+                output_file_index, result_columns, task, error_statistics_by_max_s_case = result_batch
+                result_table = build_result_table(result_columns,
+                                                  candidate_estimator_formula_names)
+                for max_s_case in unique(result_table[max_s_case_partition_column]).to_pylist():
+                    partition_key = (max_s_case, output_file_index + 1)
+                    partition_buffer = partition_buffers.setdefault(partition_key, [])
+                    partition_buffer.append(result_table.filter(equal(result_table[max_s_case_partition_column],
+                                                                      max_s_case)))
+                    if sum(partition_table.num_rows for partition_table in partition_buffer) \
+                            >= parquet_rows_per_file:
+                        parquet_file_path = write_parquet_file(partition_buffer,
+                                                               get_parquet_partition_path(output_directory_path,
+                                                                                          *partition_key),
+                                                               checkpoint_index,
+                                                               file_sequence)
+                        pending_parquet_files.append(parquet_file_path)
+                        file_sequence = file_sequence + 1
+                        partition_buffers[partition_key] = []
+                pending_tiles.extend([output_file_index, tile] for tile in task)
+                merge_error_statistics_by_max_s_range(pending_error_statistics,
+                                                      error_statistics_by_max_s_case)
+            if result_batch is None or time() - last_checkpoint_time >= checkpoint_interval:
+                for partition_key, partition_buffer in partition_buffers.items():
+                    if partition_buffer:
+                        parquet_file_path = write_parquet_file(partition_buffer,
+                                                               get_parquet_partition_path(output_directory_path,
+                                                                                          *partition_key),
+                                                               checkpoint_index,
+                                                               file_sequence)
+                        pending_parquet_files.append(parquet_file_path)
+                        file_sequence = file_sequence + 1
+                partition_buffers = {}
+                sync_parquet_files(pending_parquet_files)
+                pending_parquet_files = []
+                checkpoint_index = write_checkpoint({},
+                                                    pending_tiles,
+                                                    pending_error_statistics,
+                                                    checkpoint_index,
+                                                    manifest_file,
+                                                    statistics_file)
+                pending_tiles = []
+                pending_error_statistics = {}
+                last_checkpoint_time = time()
+            if result_batch is None:
+                break
+    return checkpoint_index
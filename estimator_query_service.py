@@ -0,0 +1,170 @@
+from configparser import ConfigParser
+from estimator_parallel import check_if_file_exists, check_if_is_valid_actual_d_a_engine, estimate_result, \
+    max_s_case_labels
+from functools import lru_cache
+from json import JSONDecodeError, dumps, loads
+from pathlib import Path
+from sys import argv, stderr, stdin, stdout
+from time import time
+from typing import Callable, List, TextIO
+
+# JSON-Lines Protocol (One Request per Line on stdin, One Response per Line on stdout):
+#   {"n": 10, "max_s": 3}                            -> Result Object
+#   {"queries": [{"n": 10, "max_s": 3}, ...]}        -> {"results": [Result or Error Object, ...]}
+#   {"command": "cache_info"}                        -> {"hits": ..., "misses": ..., "size": ..., "maximum_size": ...}
+# Malformed Requests Get an {"error": "..."} Response and the Service Keeps Running
+result_field_names = ["n",
+                      "max_s",
+                      "max_s_bounds",
+                      "actual_d_a",
+                      "estimated_d_a",
+                      "absolute_error",
+                      "relative_error",
+                      "percent_error"]
+
+
+def check_if_has_valid_number_of_arguments(argv_list: list) -> None:
+    number_of_arguments_expected = 1
+    arguments_expected_list = ["query_service_config_file"]
+    number_of_arguments_provided = len(argv_list) - 1
+    if number_of_arguments_provided != number_of_arguments_expected:
+        number_of_arguments_expected_message = \
+            "".join([str(number_of_arguments_expected),
+                     " arguments were" if number_of_arguments_expected > 1 else " argument was"])
+        number_of_arguments_provided_message = \
+            "".join([str(number_of_arguments_provided),
+                     " arguments were" if number_of_arguments_provided > 1 else " argument was"])
+        invalid_number_of_arguments_message = \
+            "Invalid number of arguments provided!\n" \
+            "{0} expected: {1}\n" \
+            "{2} provided: {3}".format(number_of_arguments_expected_message,
+                                       ", ".join(arguments_expected_list),
+                                       number_of_arguments_provided_message,
+                                       ", ".join(argv_list[1:]))
+        raise ValueError(invalid_number_of_arguments_message)
+
+
+def parse_query_service_config(query_service_config_file: Path) -> List:
+    config_parser = ConfigParser()
+    config_parser.optionxform = str
+    config_parser.read(query_service_config_file,
+                       encoding="utf-8")
+    actual_d_a_engine = config_parser.get("General Settings",
+                                          "actual_d_a_engine")
+    check_if_is_valid_actual_d_a_engine(actual_d_a_engine)
+    cache_size = int(config_parser.get("General Settings",
+                                       "cache_size"))
+    query_service_config = [actual_d_a_engine,
+                            cache_size]
+    return query_service_config
+
+
+def create_cached_estimator(actual_d_a_engine: str,
+                            cache_size: int) -> Callable:
+    # Bounded LRU Cache of Result Objects, Keyed by (n, max_s)
+    @lru_cache(maxsize=cache_size)
+    def cached_estimator(n: int,
+                         max_s: int) -> dict:
+        result = estimate_result(n,
+                                 max_s,
+                                 actual_d_a_engine,
+                                 0)
+        result[2] = max_s_case_labels.get(result[2])
+        return dict(zip(result_field_names, result))
+    return cached_estimator
+
+
+def check_if_is_valid_query(query) -> None:
+    # bool Is a Subclass of int, So It Is Rejected Explicitly. n < 2 Has No Pair to Compare (Actual Dₐ = 0), and
+    # max_s Must Lie in [1, n) Like the Estimator's Pairs (Outside It There Is No max_S Case to Estimate)
+    if not isinstance(query, dict) \
+            or any(not isinstance(query.get(field_name), int) or isinstance(query.get(field_name), bool)
+                   for field_name in ["n", "max_s"]) \
+            or query["n"] < 2 \
+            or not 1 <= query["max_s"] < query["n"]:
+        invalid_query_message = \
+            "Invalid query provided! " \
+            "Expected: {{\"n\": Integer >= 2, \"max_s\": Integer in [1, n)}} " \
+            "Provided: {0}".format(dumps(query))
+        raise ValueError(invalid_query_message)
+
+
+def answer_query(cached_estimator: Callable,
+                 query) -> dict:
+    try:
+        check_if_is_valid_query(query)
+    except ValueError as invalid_query_error:
+        return {"error": str(invalid_query_error)}
+    try:
+        return cached_estimator(query["n"],
+                                query["max_s"])
+    except (OverflowError, ValueError) as estimation_error:
+        # Valid Queries Beyond the Engine's Numeric Range (Such as n = 10**400, Too Large for a float)
+        return {"error": "Estimation failed! {0}: {1}".format(type(estimation_error).__name__,
+                                                              str(estimation_error))}
+
+
+def answer_request(cached_estimator: Callable,
+                   request_line: str) -> dict:
+    try:
+        request = loads(request_line)
+    except JSONDecodeError as json_decode_error:
+        return {"error": "Invalid JSON provided! {0}".format(str(json_decode_error))}
+    if isinstance(request, dict) and "queries" in request:
+        if not isinstance(request["queries"], list):
+            return {"error": "Invalid queries provided! Expected: List of Queries"}
+        # Batched Queries
+        return {"results": [answer_query(cached_estimator, query) for query in request["queries"]]}
+    if isinstance(request, dict) and "command" in request:
+        if request["command"] != "cache_info":
+            return {"error": "Invalid command provided! Expected one of: cache_info"}
+        cache_info = cached_estimator.cache_info()
+        return {"hits": cache_info.hits,
+                "misses": cache_info.misses,
+                "size": cache_info.currsize,
+                "maximum_size": cache_info.maxsize}
+    return answer_query(cached_estimator,
+                        request)
+
+
+def serve_queries(cached_estimator: Callable,
+                  request_stream: TextIO,
+                  response_stream: TextIO) -> None:
+    # Each Response Is Flushed at Once, So Clients Can Wait for It Before Sending the Next Request
+    for request_line in request_stream:
+        if not request_line.strip():
+            continue
+        response_stream.write(dumps(answer_request(cached_estimator, request_line)) + "\n")
+        response_stream.flush()
+
+
+def run_query_service(argv_list: list) -> None:
+    # Begin
+    begin_time = time()
+    # Print Application Start Notice (Notices Go to stderr, stdout Carries Only Responses)
+    print("D_a Estimator Query Service Application Started!", file=stderr)
+    # Check if Has Valid Number of Arguments
+    check_if_has_valid_number_of_arguments(argv_list)
+    # Read Query Service Config File
+    query_service_config_file = Path(argv_list[1])
+    # Check If Query Service Config File Exists
+    check_if_file_exists(query_service_config_file)
+    # Parse Query Service Config
+    actual_d_a_engine, cache_size = parse_query_service_config(query_service_config_file)
+    # Create Cached Estimator
+    cached_estimator = create_cached_estimator(actual_d_a_engine,
+                                               cache_size)
+    # Serve Queries Until stdin Is Closed
+    serve_queries(cached_estimator,
+                  stdin,
+                  stdout)
+    # Print Application End Notice
+    print("D_a Estimator Query Service Application Finished Successfully!", file=stderr)
+    end_time = time()
+    print("Duration Time: {0} seconds.".format(end_time - begin_time), file=stderr)
+    # End
+    exit(0)
+
+
+if __name__ == "__main__":
+    run_query_service(argv)
@@ -0,0 +1,172 @@
+from csv import reader
+from math import ceil
+from pathlib import Path
+from random import Random
+from typing import Iterator, List
+
+# Written to the Output Directory, With the Population and Sample Size of Each Stratum (to Weight the Strata)
+sampling_strata_file_name = "_sampling_strata.csv"
+
+
+def get_n_decade(n: int) -> int:
+    # Number of Digits of n, Identifying Its n Decade [10ᵏ, 10ᵏ⁺¹) (and So Its Strata)
+    return len(str(n))
+
+
+def get_max_s_case_bounds(n: int,
+                          max_s_lower_bound: int,
+                          max_s_case: int) -> tuple:
+    # Inclusive max_s Bounds of the max_S Case at n:
+    # First Case = [1, ceil(n / 2) - 1], Second Case = [ceil(n / 2), n - 1]
+    half_n = ceil(n / 2)
+    if max_s_case == 1:
+        return max(max_s_lower_bound, 1), half_n - 1
+    return max(max_s_lower_bound, half_n), n - 1
+
+
+def count_max_s_case_pairs(n: int,
+                           max_s_lower_bound: int,
+                           max_s_case: int) -> int:
+    max_s_begin, max_s_end = get_max_s_case_bounds(n,
+                                                   max_s_lower_bound,
+                                                   max_s_case)
+    return max(max_s_end - max_s_begin + 1, 0)
+
+
+def generate_strata(n_lower_bound: int,
+                    n_upper_bound: int) -> List[tuple]:
+    # (max_S Case, n Begin, n End) Strata: Both max_S Cases Times Each n Decade [10ᵏ, 10ᵏ⁺¹) Within the n Bounds
+    strata = []
+    decade_begin = 1
+    while decade_begin <= n_upper_bound:
+        n_begin = max(decade_begin, n_lower_bound, 2)
+        n_end = min(decade_begin * 10 - 1, n_upper_bound)
+        if n_begin <= n_end:
+            for max_s_case in [1, 2]:
+                strata.append((max_s_case, n_begin, n_end))
+        decade_begin = decade_begin * 10
+    return strata
+
+
+def sample_stratum(stratum: tuple,
+                   max_s_lower_bound: int,
+                   samples_per_stratum: int,
+                   sampling_seed: int) -> List:
+    # Uniform Sample Without Replacement of the Stratum (n, max_s) Pairs. Returns [Sampled Pairs, Population Size].
+    # Each Stratum Has Its Own Seeded Generator, So Its Sample Does Not Depend on the Other Strata
+    max_s_case, n_begin, n_end = stratum
+    random_generator = Random("{0}:{1}:{2}".format(sampling_seed, max_s_case, n_begin))
+    population_size = sum(count_max_s_case_pairs(n, max_s_lower_bound, max_s_case) for n in range(n_begin, n_end + 1))
+    if population_size <= 2 * samples_per_stratum:
+        # Small Stratum: Enumerate It
+        stratum_pairs = []
+        for n in range(n_begin, n_end + 1):
+            max_s_begin, max_s_end = get_max_s_case_bounds(n,
+                                                           max_s_lower_bound,
+                                                           max_s_case)
+            stratum_pairs.extend((n, max_s) for max_s in range(max_s_begin, max_s_end + 1))
+        return [random_generator.sample(stratum_pairs, min(samples_per_stratum, population_size)), population_size]
+    # Large Stratum: Draw n With Probability Proportional to Its Number of Pairs (by Rejection, as the Number of
+    # Pairs Does Not Decrease With n), Then max_s Uniformly
+    maximum_number_of_pairs = count_max_s_case_pairs(n_end, max_s_lower_bound, max_s_case)
+    sampled_pairs = set()
+    while len(sampled_pairs) < samples_per_stratum:
+        n = random_generator.randint(n_begin, n_end)
+        if random_generator.random() * maximum_number_of_pairs >= count_max_s_case_pairs(n,
+                                                                                           max_s_lower_bound,
+                                                                                           max_s_case):
+            continue
+        max_s_begin, max_s_end = get_max_s_case_bounds(n,
+                                                       max_s_lower_bound,
+                                                       max_s_case)
+        sampled_pairs.add((n, random_generator.randint(max_s_begin, max_s_end)))
+    return [list(sampled_pairs), population_size]
+
+
+def generate_sampled_tiles(n_lower_bound: int,
+                           n_upper_bound: int,
+                           max_s_lower_bound: int,
+                           samples_per_stratum: int,
+                           sampling_seed: int) -> List:
+    # Returns [Tiles of the Sampled Pairs (Consecutive max_s of an n Merged), Strata Sizes]
+    sampled_pairs = []
+    strata_sizes = []
+    for stratum in generate_strata(n_lower_bound,
+                                   n_upper_bound):
+        stratum_pairs, population_size = sample_stratum(stratum,
+                                                        max_s_lower_bound,
+                                                        samples_per_stratum,
+                                                        sampling_seed)
+        sampled_pairs.extend(stratum_pairs)
+        strata_sizes.append([*stratum, population_size, len(stratum_pairs)])
+    tiles = []
+    for n, max_s in sorted(sampled_pairs):
+        if tiles and tiles[-1][0] == n and tiles[-1][2] == max_s:
+            tiles[-1] = (n, tiles[-1][1], max_s + 1)
+        else:
+            tiles.append((n, max_s, max_s + 1))
+    return [tiles, strata_sizes]
+
+
+def group_sampled_tiles_into_tasks(tiles: list,
+                                   max_s_tile_size: int,
+                                   n_range_per_output_file: int) -> list:
+    # Sampled Tiles Are Small, So Consecutive Ones Are Grouped Into Tasks of Up to max_s_tile_size Pairs,
+    # Never Crossing an Output File Boundary Nor an n Decade (So Each Task Belongs to the Strata of One n Decade)
+    tasks = []
+    task = []
+    task_number_of_pairs = 0
+    for tile in tiles:
+        if task and (task_number_of_pairs >= max_s_tile_size
+                     or ceil(tile[0] / n_range_per_output_file) != ceil(task[0][0] / n_range_per_output_file)
+                     or get_n_decade(tile[0]) != get_n_decade(task[0][0])):
+            tasks.append(task)
+            task = []
+            task_number_of_pairs = 0
+        task.append(tile)
+        task_number_of_pairs = task_number_of_pairs + tile[2] - tile[1]
+    if task:
+        tasks.append(task)
+    return tasks
+
+
+def write_sampling_strata_file(sampling_strata_file: Path,
+                               strata_sizes: List) -> None:
+    with open(file=sampling_strata_file, mode="w") as strata_file:
+        strata_file.write("max_S Case,n Begin,n End,Population Size,Sample Size\n")
+        for stratum_sizes in strata_sizes:
+            strata_file.write("{0},{1},{2},{3},{4}\n".format(*stratum_sizes))
+
+
+def load_sampling_strata_file(sampling_strata_file: Path) -> List:
+    with open(file=sampling_strata_file, mode="r", newline="") as strata_file:
+        strata_reader = reader(strata_file)
+        next(strata_reader, None)
+        return [[int(stratum_field) for stratum_field in stratum_sizes] for stratum_sizes in strata_reader]
+
+
+def get_stratum_weights(strata_sizes: List,
+                        max_s_case_labels: dict) -> dict:
+    # Weight of Each (max_S Bounds, n Decade) Stratum: Its Population Size Over Its Sample Size
+    return {(str(max_s_case_labels.get(max_s_case)), get_n_decade(n_begin)): population_size / sample_size
+            for max_s_case, n_begin, n_end, population_size, sample_size in strata_sizes
+            if sample_size > 0}
+
+
+def get_stratum_labels(strata_sizes: List,
+                       max_s_case_labels: dict) -> dict:
+    return {(str(max_s_case_labels.get(max_s_case)), get_n_decade(n_begin)):
+            "{0} (n in [{1}, {2}])".format(max_s_case_labels.get(max_s_case), n_begin, n_end)
+            for max_s_case, n_begin, n_end, population_size, sample_size in strata_sizes}
+
+
+def key_error_statistics_by_stratum(result_batches: Iterator[list]) -> Iterator[list]:
+    # Re-Key the Error Statistics of Each Task From max_S Case to Stratum: n Decade * 10 + max_S Case
+    # (Tasks Never Cross an n Decade, See group_sampled_tiles_into_tasks)
+    for output_file_index, result_batch, task, error_statistics_by_max_s_case in result_batches:
+        n_decade = get_n_decade(task[0][0])
+        yield [output_file_index,
+               result_batch,
+               task,
+               {n_decade * 10 + max_s_case: error_statistics
+                for max_s_case, error_statistics in error_statistics_by_max_s_case.items()}]
@@ -0,0 +1,183 @@
+from error_statistics import create_error_statistics
+from estimator_parallel import max_s_case_labels
+from numpy import arange, array, ceil, count_nonzero, cumsum, float64, int8, int64, maximum, ndarray, repeat, \
+    unique, where, zeros
+from typing import List
+
+
+def generate_grid_pairs(tiles: list) -> List[ndarray]:
+    # Flatten the (n, max_s_begin, max_s_end) Tiles of the Triangular Grid Into (n, max_s) Pairs,
+    # in the Same Order parallel_task Visits Them
+    tiles_n, tiles_max_s_begin, tiles_max_s_end = (array(tiles_column, dtype=int64) for tiles_column in zip(*tiles))
+    number_of_max_s_values = maximum(tiles_max_s_end - tiles_max_s_begin, 0)
+    n_grid = repeat(tiles_n, number_of_max_s_values)
+    tiles_offsets = cumsum(number_of_max_s_values) - number_of_max_s_values
+    max_s_grid = arange(n_grid.size, dtype=int64) \
+        - repeat(tiles_offsets - tiles_max_s_begin, number_of_max_s_values)
+    return [n_grid, max_s_grid]
+
+
+def get_case_of_max_s_grid(n: ndarray,
+                           max_s: ndarray) -> ndarray:
+    # Case Codes Match get_case_of_max_s: 0 = None, 1 = First Case, 2 = Second Case
+    case_max_s = zeros(n.size, dtype=int8)
+    half_n = n / 2
+    case_max_s[(1 <= max_s) & (max_s < half_n)] = 1
+    case_max_s[(half_n <= max_s) & (max_s < n)] = 2
+    return case_max_s
+
+
+def count_sequences_indices_batches_grid(n: ndarray,
+                                         max_s: ndarray) -> ndarray:
+    # Vectorized count_sequences_indices_batches_by_closed_form
+    batch_size = where(max_s >= 1, max_s, n)
+    number_of_rows = maximum(n - 1, 0)
+    whole_blocks = number_of_rows // maximum(batch_size, 1)
+    remaining_rows = number_of_rows - whole_blocks * batch_size
+    return batch_size * whole_blocks * (whole_blocks + 1) // 2 + remaining_rows * (whole_blocks + 1)
+
+
+def estimate_total_number_of_diffs_grid(n: ndarray,
+                                        max_s: ndarray,
+                                        case_max_s: ndarray) -> ndarray:
+    # Vectorized estimate_total_number_of_diffs (Same Float Operations, ceil and int Truncation)
+    estimated_total_number_of_diffs = zeros(n.size, dtype=int64)
+    first_case = case_max_s == 1
+    n_first_case = n[first_case]
+    max_s_first_case = max_s[first_case]
+    estimated_total_number_of_diffs[first_case] = \
+        ceil((n_first_case / max_s_first_case) * ((n_first_case - 1) - ((n_first_case - max_s_first_case) / 2)))
+    second_case = case_max_s == 2
+    estimated_total_number_of_diffs[second_case] = 2 * ((n[second_case] - 1) - (max_s[second_case] / 2))
+    return estimated_total_number_of_diffs
+
+
+def estimate_total_number_of_diffs_by_mean_ceiling_grid(n: ndarray,
+                                                        max_s: ndarray) -> ndarray:
+    # Vectorized estimate_total_number_of_diffs_by_mean_ceiling
+    estimated_total_number_of_diffs = zeros(n.size, dtype=int64)
+    single_case = (1 <= max_s) & (max_s < n)
+    n_single_case = n[single_case]
+    max_s_single_case = max_s[single_case]
+    estimated_total_number_of_diffs[single_case] = \
+        -(-((n_single_case - 1) * (n_single_case + max_s_single_case - 1)) // (2 * max_s_single_case))
+    return estimated_total_number_of_diffs
+
+
+def estimate_total_number_of_diffs_by_first_case_only_grid(n: ndarray,
+                                                           max_s: ndarray) -> ndarray:
+    # Vectorized estimate_total_number_of_diffs_by_first_case_only
+    estimated_total_number_of_diffs = zeros(n.size, dtype=int64)
+    single_case = (1 <= max_s) & (max_s < n)
+    n_single_case = n[single_case]
+    max_s_single_case = max_s[single_case]
+    estimated_total_number_of_diffs[single_case] = \
+        ceil((n_single_case / max_s_single_case) * ((n_single_case - 1) - ((n_single_case - max_s_single_case) / 2)))
+    return estimated_total_number_of_diffs
+
+
+# Vectorized Counterparts of the Candidates of estimator_parallel.estimator_formulas
+estimator_formulas_grid = {"mean_ceiling": estimate_total_number_of_diffs_by_mean_ceiling_grid,
+                           "first_case_only": estimate_total_number_of_diffs_by_first_case_only_grid}
+
+
+def calculate_absolute_error_of_total_number_of_diffs_estimation_grid(estimated_total_number_of_diffs: ndarray,
+                                                                      actual_total_number_of_diffs: ndarray) \
+        -> ndarray:
+    return estimated_total_number_of_diffs - actual_total_number_of_diffs
+
+
+def calculate_relative_error_of_total_number_of_diffs_estimation_grid(estimated_total_number_of_diffs: ndarray,
+                                                                      actual_total_number_of_diffs: ndarray) \
+        -> ndarray:
+    return (estimated_total_number_of_diffs - actual_total_number_of_diffs).astype(float64) \
+        / actual_total_number_of_diffs.astype(float64)
+
+
+def calculate_percent_error_of_total_number_of_diffs_estimation_grid(estimated_total_number_of_diffs: ndarray,
+                                                                     actual_total_number_of_diffs: ndarray) \
+        -> ndarray:
+    return calculate_relative_error_of_total_number_of_diffs_estimation_grid(estimated_total_number_of_diffs,
+                                                                             actual_total_number_of_diffs) * 100
+
+
+def evaluate_grid(n: ndarray,
+                  max_s: ndarray) -> List[ndarray]:
+    # Get Case of max_s
+    case_max_s = get_case_of_max_s_grid(n,
+                                        max_s)
+    # Get Actual Total Number of Diffs (Dₐ)
+    actual_d_a = count_sequences_indices_batches_grid(n,
+                                                      max_s)
+    # Estimate Total Number of Diffs (Dₐ Estimation)
+    estimated_d_a = estimate_total_number_of_diffs_grid(n,
+                                                        max_s,
+                                                        case_max_s)
+    # Calculate Absolute, Relative and Percent Errors of Dₐ Estimation
+    d_a_estimation_absolute_error = \
+        calculate_absolute_error_of_total_number_of_diffs_estimation_grid(estimated_d_a,
+                                                                          actual_d_a)
+    d_a_estimation_relative_error = \
+        calculate_relative_error_of_total_number_of_diffs_estimation_grid(estimated_d_a,
+                                                                          actual_d_a)
+    d_a_estimation_percent_error = \
+        calculate_percent_error_of_total_number_of_diffs_estimation_grid(estimated_d_a,
+                                                                         actual_d_a)
+    return [n,
+            max_s,
+            case_max_s,
+            actual_d_a,
+            estimated_d_a,
+            d_a_estimation_absolute_error,
+            d_a_estimation_relative_error,
+            d_a_estimation_percent_error]
+
+
+def evaluate_candidate_grid(n: ndarray,
+                            max_s: ndarray,
+                            actual_d_a: ndarray,
+                            candidate_estimator_formula_names: List[str]) -> List[ndarray]:
+    # Vectorized estimate_candidate_results: Estimated Dₐ and Errors of Each Candidate, Against the Same Actual Dₐ
+    candidate_grid = []
+    for candidate_estimator_formula_name in candidate_estimator_formula_names:
+        estimated_d_a = estimator_formulas_grid[candidate_estimator_formula_name](n,
+                                                                                  max_s)
+        candidate_grid.extend([estimated_d_a,
+                               calculate_absolute_error_of_total_number_of_diffs_estimation_grid(estimated_d_a,
+                                                                                                 actual_d_a),
+                               calculate_relative_error_of_total_number_of_diffs_estimation_grid(estimated_d_a,
+                                                                                                 actual_d_a),
+                               calculate_percent_error_of_total_number_of_diffs_estimation_grid(estimated_d_a,
+                                                                                                actual_d_a)])
+    return candidate_grid
+
+
+def format_grid_result_lines(grid: List[ndarray]) -> str:
+    # Convert to Python Scalars First, So Numbers Are Formatted Exactly as in estimator_parallel.format_result_line
+    grid_columns = [grid_column.tolist() for grid_column in grid]
+    grid_columns[2] = [max_s_case_labels.get(case_max_s) for case_max_s in grid_columns[2]]
+    result_lines = [",".join([str(grid_field) for grid_field in grid_row]) + "\n" for grid_row in zip(*grid_columns)]
+    return "".join(result_lines)
+
+
+def aggregate_grid_errors(grid: List[ndarray]) -> dict:
+    # Vectorized Error Statistics per max_S Case, Mergeable With the Ones of error_statistics
+    error_statistics_by_max_s_case = {}
+    for max_s_case in unique(grid[2]).tolist():
+        is_max_s_case = grid[2] == max_s_case
+        relative_errors = grid[6][is_max_s_case]
+        percent_errors = grid[7][is_max_s_case]
+        error_statistics = create_error_statistics()
+        error_statistics[0] = relative_errors.size
+        erroneous = relative_errors != 0.0
+        error_statistics[2] = int(count_nonzero(erroneous))
+        error_statistics[1] = error_statistics[0] - error_statistics[2]
+        if error_statistics[2] > 0:
+            for moments_index, erroneous_errors in [(3, relative_errors[erroneous]), (4, percent_errors[erroneous])]:
+                erroneous_errors_mean = erroneous_errors.mean()
+                error_statistics[moments_index] = [erroneous_errors.min().item(),
+                                                   erroneous_errors.max().item(),
+                                                   erroneous_errors_mean.item(),
+                                                   ((erroneous_errors - erroneous_errors_mean) ** 2).sum().item()]
+        error_statistics_by_max_s_case[max_s_case] = error_statistics
+    return error_statistics_by_max_s_case